@@ -19,7 +19,7 @@ from .logging_config import (
 )
 from .project_config import ProjectConfigManager
 from .transforms import apply_transforms
-from .utils import format_number, format_size, get_content_stats
+from .utils import find_files, format_number, format_size, get_content_stats
 
 logger = get_logger(__name__)
 
@@ -317,18 +317,28 @@ def fetch(
     help="Keep workspace after processing",
 )
 @click.option("--metrics-output", default="", help="Output path for batch metrics JSON")
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Number of projects fetched in parallel",
+)
 def batch_fetch(
     projects: str,
     out: str,
     workspace: str,
     keep_workspace: bool,
     metrics_output: str,
+    concurrency: int,
 ) -> None:
     """Fetch and process documentation from multiple configured projects.
 
-    This command processes multiple projects in sequence, providing
-    comprehensive metrics for the entire batch operation.
+    This command runs up to --concurrency project fetches at a time,
+    providing comprehensive metrics for the entire batch operation.
     """
+    import shutil
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
     from pathlib import Path
 
     # Parse project list
@@ -355,33 +365,54 @@ def batch_fetch(
     total_written = 0
     total_errors = 0
 
-    try:
-        for project_name in project_list:
-            logger.info(f"Processing project: {project_name}")
+    # Parallel fetches share the workspace, so none of them may clean it up
+    # while others are still cloning; the batch cleans it once at the end
+    child_keeps_workspace = keep_workspace or concurrency > 1
 
-            try:
-                # Use subprocess to call the fetch command for each project
-                import subprocess
+    def fetch_project(project_name: str) -> subprocess.CalledProcessError | None:
+        """Run the fetch command for one project, returning its failure if any."""
+        logger.info(f"Processing project: {project_name}")
 
-                subprocess.run(
-                    [
-                        "poetry",
-                        "run",
-                        "contextor",
-                        "fetch",
-                        "--project-config",
-                        project_name,
-                        "--out",
-                        out,
-                        "--workspace",
-                        workspace,
-                        "--keep-workspace" if keep_workspace else "--clean-workspace",
-                    ],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+        try:
+            # Use subprocess to call the fetch command for each project
+            subprocess.run(
+                [
+                    "poetry",
+                    "run",
+                    "contextor",
+                    "fetch",
+                    "--project-config",
+                    project_name,
+                    "--out",
+                    out,
+                    "--workspace",
+                    workspace,
+                    (
+                        "--keep-workspace"
+                        if child_keeps_workspace
+                        else "--clean-workspace"
+                    ),
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            return e
+        return None
 
+    try:
+        # Fetches are dominated by cloning and child processes, so threads
+        # only wait on them; results are collected in project order
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            failures = list(executor.map(fetch_project, project_list))
+
+        if not keep_workspace and child_keeps_workspace:
+            logger.info("Cleaning up workspace", path=workspace)
+            shutil.rmtree(workspace, ignore_errors=True)
+
+        for project_name, failure in zip(project_list, failures, strict=True):
+            if failure is None:
                 # Try to read the generated stats
                 project_stats_path = (
                     Path(out) / project_name / ".metadata" / "stats.json"
@@ -414,15 +445,15 @@ def batch_fetch(
                         }
                     )
 
-            except subprocess.CalledProcessError as e:
+            else:
                 logger.error(
-                    f"Failed to process project {project_name}", error=e.stderr
+                    f"Failed to process project {project_name}", error=failure.stderr
                 )
                 batch_results.append(
                     {
                         "project": project_name,
                         "success": False,
-                        "error": e.stderr,
+                        "error": failure.stderr,
                     }
                 )
                 total_errors += 1
@@ -936,7 +967,7 @@ def intelligence(
         raise click.Abort()
 
     # Check for .mdc files
-    mdc_files = list(source_path.rglob("*.mdc"))
+    mdc_files = find_files(source_path, ".mdc")
     if not mdc_files:
         logger.error("No .mdc files found in source directory", source_dir=source_dir)
         raise click.Abort()
@@ -1160,7 +1191,7 @@ def tokens(source_dir: str, detailed: bool, output: str) -> None:
         raise click.Abort()
 
     # Find all .mdc files
-    mdc_files = list(source_path.rglob("*.mdc"))
+    mdc_files = find_files(source_path, ".mdc")
     if not mdc_files:
         logger.error("No .mdc files found in source directory", source_dir=source_dir)
         raise click.Abort()
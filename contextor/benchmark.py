@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from .logging_config import get_logger, log_operation, log_operation_complete
+from .utils import find_files
 
 logger = get_logger(__name__)
 
@@ -95,7 +96,7 @@ class PerformanceBenchmark:
                     f.write("```\n")
 
             # Calculate total size
-            total_size = sum(f.stat().st_size for f in dataset_path.rglob("*.md"))
+            total_size = sum(f.stat().st_size for f in find_files(dataset_path, ".md"))
 
             log_operation_complete(
                 logger,
@@ -206,14 +207,10 @@ class PerformanceBenchmark:
                 duration = end_time - start_time
 
                 # Calculate file statistics
-                input_files = list(src_path.rglob("*.md")) + list(
-                    src_path.rglob("*.mdx")
-                )
+                input_files = find_files(src_path, (".md", ".mdx"))
                 total_input_size = sum(f.stat().st_size for f in input_files)
 
-                output_files = (
-                    list(out_path.rglob("*.mdc")) if out_path.exists() else []
-                )
+                output_files = find_files(out_path, ".mdc")
                 total_output_size = sum(f.stat().st_size for f in output_files)
 
                 result = {
@@ -3,17 +3,40 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import frontmatter
 import structlog
 
+from .mdc_reader import read_mdc
 from .utils import content_hash, ensure_directory, get_content_stats, path_to_slug
 
 logger = structlog.get_logger()
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_buffers(fd: int, buffers: list[bytes]) -> None:
+    """Write all buffers to fd, using one vectored syscall where available."""
+    if not hasattr(os, "writev"):
+        for buffer in buffers:
+            view = memoryview(buffer)
+            while view:
+                view = view[os.write(fd, view) :]
+        return
+
+    pending = [memoryview(b) for b in buffers if b]
+    while pending:
+        written = os.writev(fd, pending)
+        # Drop fully written buffers and trim a partially written one
+        while pending and written >= len(pending[0]):
+            written -= len(pending[0])
+            pending.pop(0)
+        if pending and written:
+            pending[0] = pending[0][written:]
+
 
 class MDCEmitter:
     """Emits .mdc files and maintains index.jsonl manifest."""
@@ -27,6 +50,10 @@ class MDCEmitter:
         self.output_dir = Path(output_dir)
         self.index_path = self.output_dir / "index.jsonl"
 
+        # Serialized index lines by slug, in file order; loaded on the first
+        # index update so later updates need not re-read the file
+        self._index_lines: dict[Any, str] | None = None
+
         # Track cumulative statistics
         self.cumulative_stats = {
             "files": 0,
@@ -56,8 +83,11 @@ class MDCEmitter:
         Returns:
             True if file was written, False if skipped (no changes)
         """
+        # Encode once; the bytes are hashed, measured and written
+        content_bytes = content.encode("utf-8")
+
         # Generate content hash
-        current_hash = content_hash(content)
+        current_hash = content_hash(content_bytes)
 
         # Generate slug for filename
         source = metadata.get("repo", "unknown").split("/")[-1]  # Get repo name
@@ -104,13 +134,13 @@ class MDCEmitter:
             return False
 
         # Calculate content size in bytes
-        content_size_bytes = len(content.encode("utf-8"))
+        content_size_bytes = len(content_bytes)
 
         # Update cumulative statistics
         self._update_cumulative_stats(content_stats, content_size_bytes)
 
         # Write .mdc file
-        self._write_mdc_file(mdc_path, frontmatter, content)
+        self._write_mdc_file(mdc_path, frontmatter, content_bytes)
 
         # Update index
         self._update_index(slug, frontmatter)
@@ -125,11 +155,9 @@ class MDCEmitter:
 
         try:
             # Read existing file and parse frontmatter
-            with open(mdc_path, encoding="utf-8") as f:
-                post = frontmatter.load(f)
+            existing_hash = read_mdc(mdc_path).metadata.get("content_hash")
 
             # Check if hash matches
-            existing_hash = post.metadata.get("content_hash")
             if existing_hash == current_hash:
                 return True
 
@@ -139,7 +167,7 @@ class MDCEmitter:
         return False
 
     def _write_mdc_file(
-        self, path: Path, frontmatter: dict[str, Any], content: str
+        self, path: Path, frontmatter: dict[str, Any], content: bytes
     ) -> None:
         """Write .mdc file with YAML frontmatter and content."""
 
@@ -147,14 +175,21 @@ class MDCEmitter:
         yaml_lines = ["---"]
         yaml_lines.extend(self._dict_to_yaml(frontmatter, indent=0))
         yaml_lines.append("---")
-        yaml_lines.append("")  # Empty line after frontmatter
-
-        # Combine frontmatter and content
-        full_content = "\n".join(yaml_lines) + content
 
-        # Write file
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        # Hand header, separator and body to the kernel in a single writev,
+        # then atomically move the finished file into place
+        buffers = [
+            "\n".join(yaml_lines).encode("utf-8"),
+            b"\n",
+            content,
+        ]
+        tmp_path = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp_path, _WRITE_FLAGS, 0o644)
+        try:
+            _write_buffers(fd, buffers)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
 
     def _dict_to_yaml(self, data: Any, indent: int = 0) -> list[str]:
         """Convert dictionary to YAML lines (simple implementation)."""
@@ -183,40 +218,67 @@ class MDCEmitter:
     def _update_index(self, slug: str, frontmatter: dict[str, Any]) -> None:
         """Update the index.jsonl manifest file."""
 
+        source = frontmatter.get("source", {})
+
         # Create index entry with token statistics
         index_entry = {
             "slug": slug,
             "title": frontmatter.get("title"),
-            "path": frontmatter.get("source", {}).get("path"),
-            "repo": frontmatter.get("source", {}).get("repo"),
-            "ref": frontmatter.get("source", {}).get("ref"),
+            "path": source.get("path"),
+            "repo": source.get("repo"),
+            "ref": source.get("ref"),
             "topics": frontmatter.get("topics", []),
             "content_hash": frontmatter.get("content_hash"),
             "fetched_at": frontmatter.get("fetched_at"),
             "stats": frontmatter.get("stats", {}),
         }
 
-        # Read existing index entries
-        existing_entries = []
-        if self.index_path.exists():
-            try:
-                with open(self.index_path, encoding="utf-8") as f:
-                    existing_entries = [
-                        json.loads(line.strip()) for line in f if line.strip()
-                    ]
-            except Exception as e:
-                logger.warning("Failed to read existing index", error=str(e))
-
-        # Remove existing entry for this slug
-        existing_entries = [e for e in existing_entries if e.get("slug") != slug]
+        rewrite = False
+        if self._index_lines is None:
+            self._index_lines, rewrite = self._load_index_lines()
+        index_lines = self._index_lines
 
-        # Add new entry
-        existing_entries.append(index_entry)
+        # An updated entry moves to the end, which needs a rewrite; a new
+        # slug, the common case, is appended without touching the rest
+        if slug in index_lines:
+            del index_lines[slug]
+            rewrite = True
+        line = json.dumps(index_entry) + "\n"
+        index_lines[slug] = line
 
         # Write updated index
-        with open(self.index_path, "w", encoding="utf-8") as f:
-            for entry in existing_entries:
-                f.write(json.dumps(entry) + "\n")
+        if rewrite:
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                f.writelines(index_lines.values())
+        else:
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    def _load_index_lines(self) -> tuple[dict[Any, str], bool]:
+        """Read the existing index as serialized lines keyed by slug.
+
+        Returns:
+            The lines, and whether the file must be rewritten rather than
+            appended to (it was unreadable or not in canonical line form)
+        """
+        if not self.index_path.exists():
+            return {}, False
+
+        index_lines: dict[Any, str] = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                raw = f.read()
+            for position, line in enumerate(raw.splitlines()):
+                line = line.strip()
+                if line:
+                    # Entries without a slug are kept, each under its own key
+                    slug = json.loads(line).get("slug")
+                    index_lines[slug if slug is not None else position] = line + "\n"
+        except Exception as e:
+            logger.warning("Failed to read existing index", error=str(e))
+            return {}, True
+
+        return index_lines, "".join(index_lines.values()) != raw
 
     def _update_cumulative_stats(
         self, content_stats: dict[str, Any], size_bytes: int
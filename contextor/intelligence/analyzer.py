@@ -1,21 +1,56 @@
 """Main intelligence analyzer orchestrating all analysis components."""
 
 import json
+import re
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import frontmatter
 import structlog
+import yaml
 
-from ..utils import content_hash
+from ..mdc_reader import MDCFile, read_mdc
+from ..utils import dumps_json, find_files, loads_json
 from .cross_linking import CrossLinker
+from .parsing import ParsedContent, parse_content
 from .quality_scoring import QualityScorer
 from .similarity import SimilarityAnalyzer
 from .topic_extraction import TopicExtractor
 
 logger = structlog.get_logger()
 
+# Upper bound on memoized content parses kept by a long-lived analyzer; each
+# entry holds a whole document, so this is sized to one analysis pass
+PARSE_CACHE_SIZE = 256
+
+# Top-level ``intelligence:`` key plus its indented continuation lines
+_INTELLIGENCE_BLOCK_RE = re.compile(
+    r"^intelligence:[^\n]*\n(?:[ \t-][^\n]*\n|\n)*", re.MULTILINE
+)
+
+
+def _splice_intelligence_block(text: str, block: str) -> str:
+    """Insert or replace the ``intelligence`` block in raw front-matter text.
+
+    Other front-matter fields are left byte-for-byte untouched, so they are
+    never round-tripped through YAML serialization.
+    """
+    if text.startswith("---"):
+        header_start = text.find("\n") + 1
+        closing = text.find("\n---", header_start - 1)
+        if header_start > 0 and closing != -1:
+            header = text[header_start : closing + 1]
+            match = _INTELLIGENCE_BLOCK_RE.search(header)
+            if match:
+                header = header[: match.start()] + block + header[match.end() :]
+            else:
+                header += block
+            return text[:header_start] + header + text[closing + 1 :]
+
+    # No front-matter yet: create one holding only the intelligence block
+    return f"---\n{block}---\n{text}"
+
 
 class IntelligenceAnalyzer:
     """Orchestrates intelligence analysis across document collections."""
@@ -42,6 +77,12 @@ class IntelligenceAnalyzer:
         self.similarity_analyzer = SimilarityAnalyzer(self.config.get("similarity", {}))
         self.cross_linker = CrossLinker(self.config.get("cross_linking", {}))
 
+        # Content hashes computed during this run, reused when saving state
+        self._content_hashes: dict[Path, str] = {}
+
+        # Parsed content shared by the analyzers, keyed by content hash
+        self._parse_cache: OrderedDict[str, ParsedContent] = OrderedDict()
+
         # Load previous analysis state
         self.previous_state = self._load_analysis_state()
 
@@ -76,7 +117,7 @@ class IntelligenceAnalyzer:
         )
 
         # Discover .mdc files
-        mdc_files = list(self.source_dir.rglob("*.mdc"))
+        mdc_files = find_files(self.source_dir, ".mdc")
         if not mdc_files:
             logger.warning("No .mdc files found", source_dir=str(self.source_dir))
             return {"error": "No .mdc files found"}
@@ -163,10 +204,7 @@ class IntelligenceAnalyzer:
 
         for mdc_path in mdc_files:
             try:
-                with open(mdc_path, encoding="utf-8") as f:
-                    post = frontmatter.load(f)
-
-                current_hash = content_hash(post.content)
+                current_hash = self._hash_content(read_mdc(mdc_path))
                 relative_path = str(mdc_path.relative_to(self.source_dir))
 
                 # Check if file has changed since last analysis
@@ -193,38 +231,42 @@ class IntelligenceAnalyzer:
     ) -> dict[str, Any] | None:
         """Analyze a single document and extract intelligence data."""
         try:
-            with open(mdc_path, encoding="utf-8") as f:
-                post = frontmatter.load(f)
+            mdc = read_mdc(mdc_path)
+            content = mdc.content
+            metadata = mdc.metadata
+
+            parsed = self._parse_content(content, self._hash_content(mdc))
 
             doc_data = {
                 "path": mdc_path,
-                "slug": post.metadata.get("slug", ""),
-                "title": post.metadata.get("title", ""),
-                "content": post.content,
-                "metadata": post.metadata,
+                "slug": metadata.get("slug", ""),
+                "title": metadata.get("title", ""),
+                "content": content,
+                "metadata": metadata,
                 "intelligence": {},
             }
 
             # Topic extraction
             if "topic-extraction" in features:
                 extracted_topics = self.topic_extractor.extract_topics(
-                    post.content, post.metadata
+                    content, metadata, parsed
                 )
                 doc_data["intelligence"]["extracted_topics"] = extracted_topics
 
             # Quality scoring
             if "quality-scoring" in features:
                 quality_metrics = self.quality_scorer.score_quality(
-                    post.content, post.metadata
+                    content, metadata, parsed
                 )
                 doc_data["intelligence"]["quality_metrics"] = quality_metrics
 
             # Content fingerprint for similarity analysis
             if "cross-linking" in features or "duplicate-detection" in features:
-                fingerprint = self.similarity_analyzer.generate_fingerprint(
-                    post.content
-                )
+                fingerprint = self.similarity_analyzer.generate_fingerprint(content)
                 doc_data["intelligence"]["content_fingerprint"] = fingerprint
+                doc_data["intelligence"][
+                    "content_minhash"
+                ] = self.similarity_analyzer.generate_minhash(content)
 
             doc_data["intelligence"]["last_analyzed"] = (
                 datetime.utcnow().isoformat() + "Z"
@@ -236,14 +278,33 @@ class IntelligenceAnalyzer:
             logger.error("Document analysis failed", path=str(mdc_path), error=str(e))
             return None
 
+    def _hash_content(self, mdc: MDCFile) -> str:
+        """Hash document content and remember it for the rest of the run."""
+        current_hash = mdc.content_hash
+        self._content_hashes[mdc.path] = current_hash
+        return current_hash
+
+    def _parse_content(self, content: str, key: str) -> ParsedContent:
+        """Return the shared parse of content, reusing it across analyze() runs."""
+        parsed = self._parse_cache.get(key)
+        if parsed is not None:
+            self._parse_cache.move_to_end(key)
+            return parsed
+
+        parsed = parse_content(content)
+        self._parse_cache[key] = parsed
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return parsed
+
     def _analyze_relationships(
         self, documents: list[dict[str, Any]], features: set[str]
     ) -> None:
         """Analyze relationships between documents."""
         if "cross-linking" in features:
             # Find related documents
-            for doc in documents:
-                related = self.cross_linker.find_related_documents(doc, documents)
+            all_related = self.cross_linker.cross_link_all(documents)
+            for doc, related in zip(documents, all_related, strict=True):
                 doc["intelligence"]["related_documents"] = related
 
         if "duplicate-detection" in features:
@@ -258,15 +319,19 @@ class IntelligenceAnalyzer:
         """Update .mdc file with intelligence metadata."""
         mdc_path = doc_data["path"]
 
-        # Update metadata with intelligence data
-        updated_metadata = doc_data["metadata"].copy()
-        updated_metadata["intelligence"] = doc_data["intelligence"]
+        with open(mdc_path, encoding="utf-8") as f:
+            text = f.read()
 
-        # Write updated file
-        post = frontmatter.Post(doc_data["content"], **updated_metadata)
+        # Serialize only the intelligence block and splice it into the header
+        block = yaml.safe_dump(
+            {"intelligence": doc_data["intelligence"]},
+            sort_keys=False,
+            default_flow_style=False,
+            allow_unicode=True,
+        )
 
         with open(mdc_path, "w", encoding="utf-8") as f:
-            f.write(frontmatter.dumps(post))
+            f.write(_splice_intelligence_block(text, block))
 
         logger.debug("Updated document with intelligence", path=str(mdc_path))
 
@@ -276,10 +341,10 @@ class IntelligenceAnalyzer:
             # Load existing index entries
             existing_entries = {}
             if self.intelligence_index.exists():
-                with open(self.intelligence_index, encoding="utf-8") as f:
+                with open(self.intelligence_index, "rb") as f:
                     for line in f:
                         if line.strip():
-                            entry = json.loads(line.strip())
+                            entry = loads_json(line)
                             existing_entries[entry["slug"]] = entry
 
             # Update with new intelligence data
@@ -293,9 +358,11 @@ class IntelligenceAnalyzer:
                 existing_entries[doc["slug"]] = index_entry
 
             # Write updated index
-            with open(self.intelligence_index, "w", encoding="utf-8") as f:
-                for entry in existing_entries.values():
-                    f.write(json.dumps(entry) + "\n")
+            with open(self.intelligence_index, "wb") as f:
+                f.writelines(
+                    dumps_json(entry, newline=True)
+                    for entry in existing_entries.values()
+                )
 
             logger.info("Updated intelligence index", entries=len(existing_entries))
 
@@ -321,12 +388,13 @@ class IntelligenceAnalyzer:
 
             for mdc_path in analyzed_files:
                 try:
-                    with open(mdc_path, encoding="utf-8") as f:
-                        post = frontmatter.load(f)
+                    current_hash = self._content_hashes.get(mdc_path)
+                    if current_hash is None:
+                        current_hash = self._hash_content(read_mdc(mdc_path))
 
                     relative_path = str(mdc_path.relative_to(self.source_dir))
                     state[relative_path] = {
-                        "content_hash": content_hash(post.content),
+                        "content_hash": current_hash,
                         "last_analyzed": datetime.utcnow().isoformat() + "Z",
                     }
                 except Exception as e:
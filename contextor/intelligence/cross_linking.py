@@ -1,11 +1,92 @@
 """Cross-document linking and relationship analysis."""
 
+import heapq
+from collections.abc import Iterable, Set
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
 
+from .similarity import decode_minhash, minhash_lane_similarity
+
 logger = structlog.get_logger()
 
+# Relevance component weights
+_TOPIC_WEIGHT = 0.4
+_PATH_WEIGHT = 0.2
+_FINGERPRINT_WEIGHT = 0.25
+_QUALITY_WEIGHT = 0.15
+
+
+@dataclass(frozen=True)
+class _DocumentFeatures:
+    """Per-document values reused for every pair the document takes part in."""
+
+    topics: frozenset[str]  # Extracted and metadata topics combined
+    path_parts: tuple[str, ...]  # Source path components, empty if unknown
+    quality: float | None  # Overall quality score, None if not scored
+    fingerprint: str  # Content fingerprint, empty if unknown
+    minhash: tuple[int, ...]  # Decoded MinHash lanes, empty if unknown
+
+
+def _document_path_parts(doc: dict[str, Any]) -> tuple[str, ...]:
+    """Split a document's source path into components."""
+    path = doc.get("metadata", {}).get("source", {}).get("path", "")
+    return tuple(path.replace("\\", "/").split("/")) if path else ()
+
+
+def _document_quality(doc: dict[str, Any]) -> float | None:
+    """Return a document's overall quality score, or None if it has none."""
+    quality = doc.get("intelligence", {}).get("quality_metrics", {})
+    return quality.get("overall", 0.5) if quality else None
+
+
+def _fingerprint_similarity(
+    fingerprint1: str,
+    minhash1: tuple[int, ...],
+    fingerprint2: str,
+    minhash2: tuple[int, ...],
+) -> float:
+    """Content similarity from MinHash lanes, else from exact fingerprints."""
+    if minhash1 and minhash2:
+        return minhash_lane_similarity(minhash1, minhash2)
+
+    if not fingerprint1 or not fingerprint2:
+        return 0.0
+
+    return 1.0 if fingerprint1 == fingerprint2 else 0.0
+
+
+def _jaccard(set1: Set[str], set2: Set[str]) -> float:
+    """Jaccard similarity, deriving the union size from the intersection."""
+    overlap = len(set1 & set2)
+    union = len(set1) + len(set2) - overlap
+    return overlap / union if union else 0.0
+
+
+def _path_similarity(parts1: tuple[str, ...], parts2: tuple[str, ...]) -> float:
+    """Shared path prefix length relative to the deeper of two paths."""
+    if not parts1 or not parts2:
+        return 0.0
+
+    # Calculate common path prefix length
+    common_prefix = 0
+    for p1, p2 in zip(parts1, parts2, strict=False):
+        if p1 != p2:
+            break
+        common_prefix += 1
+
+    return common_prefix / max(len(parts1), len(parts2))
+
+
+def _quality_compatibility(quality1: float | None, quality2: float | None) -> float:
+    """Compatibility of two quality scores (closer scores = higher)."""
+    if quality1 is None or quality2 is None:
+        return 0.5  # Neutral if no quality data
+
+    return max(0.0, 1.0 - abs(quality1 - quality2))
+
 
 class CrossLinker:
     """Identifies relationships and suggests cross-links between documents."""
@@ -20,6 +101,58 @@ class CrossLinker:
         self.max_related_documents = self.config.get("max_related_documents", 5)
         self.topic_overlap_threshold = self.config.get("topic_overlap_threshold", 0.3)
         self.relevance_threshold = self.config.get("relevance_threshold", 0.4)
+        self.max_workers = self.config.get("max_workers", 1)
+
+        # Per-collection features and inverted topic index, built by precompute()
+        self._indexed_documents: list[dict[str, Any]] | None = None
+        self._positions: dict[int, int] = {}
+        self._features: list[_DocumentFeatures] = []
+        self._topic_index: dict[str, list[int]] = {}
+
+    def precompute(self, documents: list[dict[str, Any]]) -> None:
+        """Index a document collection before cross-linking its documents.
+
+        Topic sets, path components and quality scores are extracted once
+        per document instead of once per pair, and an inverted topic index
+        lets find_related_documents skip candidates that cannot reach the
+        relevance threshold.
+
+        Args:
+            documents: Collection later passed to find_related_documents
+        """
+        self._indexed_documents = documents
+        self._positions = {id(doc): i for i, doc in enumerate(documents)}
+        self._features = [self._document_features(doc) for doc in documents]
+
+        self._topic_index = {}
+        for i, features in enumerate(self._features):
+            for topic in features.topics:
+                self._topic_index.setdefault(topic, []).append(i)
+
+    def cross_link_all(
+        self, documents: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """Find related documents for every document in a collection.
+
+        Targets are independent, so with max_workers > 1 they are scored on
+        a thread pool sharing the read-only precomputed index.
+
+        Args:
+            documents: Collection of all documents
+
+        Returns:
+            Related documents for each input document, in input order
+        """
+        self.precompute(documents)
+
+        def find_related(doc: dict[str, Any]) -> list[dict[str, Any]]:
+            return self.find_related_documents(doc, documents)
+
+        if self.max_workers > 1 and len(documents) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return list(executor.map(find_related, documents))
+
+        return [find_related(doc) for doc in documents]
 
     def find_related_documents(
         self, target_doc: dict[str, Any], all_documents: list[dict[str, Any]]
@@ -34,21 +167,30 @@ class CrossLinker:
             List of related document information with relevance scores
         """
         related = []
-        target_intelligence = target_doc.get("intelligence", {})
-        target_topics = set(target_intelligence.get("extracted_topics", []))
-        target_metadata_topics = set(target_doc.get("metadata", {}).get("topics", []))
 
-        # Combine all target topics
-        all_target_topics = target_topics | target_metadata_topics
+        # Target features are extracted once, not once per candidate
+        indexed = all_documents is self._indexed_documents
+        position = self._positions.get(id(target_doc)) if indexed else None
+        target = (
+            self._features[position]
+            if position is not None
+            else self._document_features(target_doc)
+        )
+
+        if indexed:
+            candidates = self._candidate_indices(target.topics, len(all_documents))
+        else:
+            candidates = range(len(all_documents))
+
+        for i in candidates:
+            doc = all_documents[i]
 
-        for doc in all_documents:
             # Skip self
             if doc["slug"] == target_doc["slug"]:
                 continue
 
-            relevance_score = self._calculate_relevance(
-                target_doc, doc, all_target_topics
-            )
+            candidate = self._features[i] if indexed else self._document_features(doc)
+            relevance_score = self._calculate_relevance(target, candidate)
 
             if relevance_score >= self.relevance_threshold:
                 relationship_type = self._determine_relationship_type(
@@ -64,57 +206,103 @@ class CrossLinker:
                     }
                 )
 
-        # Sort by relevance and limit results
-        related.sort(key=lambda x: x["relevance"], reverse=True)
+        # Select the most relevant documents without sorting every candidate
+        top_related = heapq.nlargest(
+            self.max_related_documents, related, key=lambda x: x["relevance"]
+        )
 
         logger.debug(
             "Found related documents",
             target_slug=target_doc["slug"],
             related_count=len(related),
-            top_relevance=related[0]["relevance"] if related else 0,
+            top_relevance=top_related[0]["relevance"] if top_related else 0,
         )
 
-        return related[: self.max_related_documents]
+        return top_related
+
+    @staticmethod
+    def _document_topics(doc: dict[str, Any]) -> frozenset[str]:
+        """Combine a document's extracted and metadata topics."""
+        extracted = doc.get("intelligence", {}).get("extracted_topics", [])
+        return frozenset(extracted).union(doc.get("metadata", {}).get("topics", []))
+
+    @classmethod
+    def _document_features(cls, doc: dict[str, Any]) -> _DocumentFeatures:
+        """Extract the pairwise-scoring inputs of a document once."""
+        intelligence = doc.get("intelligence", {})
+        return _DocumentFeatures(
+            topics=cls._document_topics(doc),
+            path_parts=_document_path_parts(doc),
+            quality=_document_quality(doc),
+            fingerprint=intelligence.get("content_fingerprint", ""),
+            minhash=decode_minhash(intelligence.get("content_minhash", "")),
+        )
+
+    def _candidate_indices(
+        self, target_topics: frozenset[str], count: int
+    ) -> Iterable[int]:
+        """Return indexes of documents that can reach the relevance threshold.
+
+        Only when the non-topic components alone fall short of the threshold
+        are candidates restricted to documents sharing a topic with the target.
+        """
+        if _QUALITY_WEIGHT + _PATH_WEIGHT + _FINGERPRINT_WEIGHT >= (
+            self.relevance_threshold
+        ):
+            return range(count)
+
+        candidates: set[int] = set()
+        for topic in target_topics:
+            candidates.update(self._topic_index.get(topic, ()))
+        return sorted(candidates)
 
     def _calculate_relevance(
-        self, doc1: dict[str, Any], doc2: dict[str, Any], target_topics: set[str]
+        self, target: _DocumentFeatures, candidate: _DocumentFeatures
     ) -> float:
         """Calculate relevance score between two documents.
 
         Args:
-            doc1: First document (target)
-            doc2: Second document (candidate)
-            target_topics: Combined topics from target document
+            target: Precomputed features of the target document
+            candidate: Precomputed features of the candidate document
 
         Returns:
-            Relevance score (0-1)
+            Relevance score (0-1). Components are added cheapest first, and
+            once the score cannot reach relevance_threshold the remaining
+            ones are skipped and the partial score is returned.
         """
         score = 0.0
 
-        # Get topics from candidate document
-        doc2_intelligence = doc2.get("intelligence", {})
-        doc2_topics = set(doc2_intelligence.get("extracted_topics", []))
-        doc2_metadata_topics = set(doc2.get("metadata", {}).get("topics", []))
-        all_doc2_topics = doc2_topics | doc2_metadata_topics
+        # Topic overlap score
+        if target.topics and candidate.topics:
+            topic_similarity = _jaccard(target.topics, candidate.topics)
+            score += topic_similarity * _TOPIC_WEIGHT
 
-        # Topic overlap score (40% weight)
-        if target_topics and all_doc2_topics:
-            topic_overlap = len(target_topics & all_doc2_topics)
-            topic_union = len(target_topics | all_doc2_topics)
-            topic_similarity = topic_overlap / topic_union if topic_union > 0 else 0
-            score += topic_similarity * 0.4
+        # Upper bound: every remaining component scores 1.0
+        remaining = _QUALITY_WEIGHT + _PATH_WEIGHT + _FINGERPRINT_WEIGHT
+        if score + remaining < self.relevance_threshold:
+            return score
 
-        # Path similarity score (20% weight)
-        path_similarity = self._calculate_path_similarity(doc1, doc2)
-        score += path_similarity * 0.2
+        # Quality compatibility score
+        quality_compatibility = _quality_compatibility(
+            target.quality, candidate.quality
+        )
+        score += quality_compatibility * _QUALITY_WEIGHT
 
-        # Content fingerprint similarity (25% weight)
-        fingerprint_similarity = self._calculate_fingerprint_similarity(doc1, doc2)
-        score += fingerprint_similarity * 0.25
+        # Path similarity score
+        path_similarity = _path_similarity(target.path_parts, candidate.path_parts)
+        score += path_similarity * _PATH_WEIGHT
 
-        # Quality compatibility score (15% weight)
-        quality_compatibility = self._calculate_quality_compatibility(doc1, doc2)
-        score += quality_compatibility * 0.15
+        if score + _FINGERPRINT_WEIGHT < self.relevance_threshold:
+            return score
+
+        # Content fingerprint similarity
+        fingerprint_similarity = _fingerprint_similarity(
+            target.fingerprint,
+            target.minhash,
+            candidate.fingerprint,
+            candidate.minhash,
+        )
+        score += fingerprint_similarity * _FINGERPRINT_WEIGHT
 
         return min(score, 1.0)
 
@@ -150,9 +338,7 @@ class CrossLinker:
 
         # If high topic overlap, it's related content
         if doc1_topics and doc2_topics:
-            overlap_ratio = len(doc1_topics & doc2_topics) / len(
-                doc1_topics | doc2_topics
-            )
+            overlap_ratio = _jaccard(doc1_topics, doc2_topics)
             if overlap_ratio > 0.6:
                 return "related-content"
 
@@ -178,69 +364,29 @@ class CrossLinker:
         self, doc1: dict[str, Any], doc2: dict[str, Any]
     ) -> float:
         """Calculate similarity based on file paths."""
-        path1 = doc1.get("metadata", {}).get("source", {}).get("path", "")
-        path2 = doc2.get("metadata", {}).get("source", {}).get("path", "")
-
-        if not path1 or not path2:
-            return 0.0
-
-        # Split paths into components
-        parts1 = path1.replace("\\", "/").split("/")
-        parts2 = path2.replace("\\", "/").split("/")
-
-        # Calculate common path prefix length
-        common_prefix = 0
-        for p1, p2 in zip(parts1, parts2, strict=False):
-            if p1 == p2:
-                common_prefix += 1
-            else:
-                break
-
-        # Calculate similarity based on shared path depth
-        max_depth = max(len(parts1), len(parts2))
-        if max_depth == 0:
-            return 0.0
-
-        return common_prefix / max_depth
+        return _path_similarity(_document_path_parts(doc1), _document_path_parts(doc2))
 
     def _calculate_fingerprint_similarity(
         self, doc1: dict[str, Any], doc2: dict[str, Any]
     ) -> float:
-        """Calculate similarity based on content fingerprints."""
-        fingerprint1 = doc1.get("intelligence", {}).get("content_fingerprint", "")
-        fingerprint2 = doc2.get("intelligence", {}).get("content_fingerprint", "")
+        """Calculate similarity based on content fingerprints.
 
-        if not fingerprint1 or not fingerprint2:
-            return 0.0
-
-        # Simple fingerprint similarity (could be enhanced with more sophisticated methods)
-        if fingerprint1 == fingerprint2:
-            return 1.0
-
-        # Calculate character-level similarity for fingerprints
-        matches = sum(
-            1 for c1, c2 in zip(fingerprint1, fingerprint2, strict=False) if c1 == c2
+        Uses the MinHash Jaccard estimate when both documents have a
+        signature; otherwise only identical fingerprints count, since
+        digests of similar content share no structure.
+        """
+        intelligence1 = doc1.get("intelligence", {})
+        intelligence2 = doc2.get("intelligence", {})
+
+        return _fingerprint_similarity(
+            intelligence1.get("content_fingerprint", ""),
+            decode_minhash(intelligence1.get("content_minhash", "")),
+            intelligence2.get("content_fingerprint", ""),
+            decode_minhash(intelligence2.get("content_minhash", "")),
         )
-        max_length = max(len(fingerprint1), len(fingerprint2))
-
-        return matches / max_length if max_length > 0 else 0.0
 
     def _calculate_quality_compatibility(
         self, doc1: dict[str, Any], doc2: dict[str, Any]
     ) -> float:
         """Calculate compatibility based on quality scores."""
-        quality1 = doc1.get("intelligence", {}).get("quality_metrics", {})
-        quality2 = doc2.get("intelligence", {}).get("quality_metrics", {})
-
-        if not quality1 or not quality2:
-            return 0.5  # Neutral if no quality data
-
-        # Documents with similar quality levels are more compatible
-        overall1 = quality1.get("overall", 0.5)
-        overall2 = quality2.get("overall", 0.5)
-
-        # Calculate similarity in quality (closer scores = higher compatibility)
-        quality_diff = abs(overall1 - overall2)
-        compatibility = 1.0 - quality_diff
-
-        return max(0.0, compatibility)
+        return _quality_compatibility(_document_quality(doc1), _document_quality(doc2))
@@ -0,0 +1,31 @@
+"""Shared content parsing reused across intelligence analyzers."""
+
+import re
+from dataclasses import dataclass
+
+_HEADING_RE = re.compile(r"^#+\s+(.+)$", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class ParsedContent:
+    """Tokenized view of a document shared by the individual analyzers."""
+
+    content: str  # Raw document content
+    headings: tuple[str, ...]  # Markdown heading texts, in document order
+    words: tuple[str, ...]  # Whitespace-separated tokens
+
+
+def parse_content(content: str) -> ParsedContent:
+    """Parse document content once for reuse by several analyzers.
+
+    Args:
+        content: Document content text
+
+    Returns:
+        Parsed representation of the content
+    """
+    return ParsedContent(
+        content=content,
+        headings=tuple(_HEADING_RE.findall(content)),
+        words=tuple(content.split()),
+    )
@@ -1,13 +1,95 @@
 """Quality scoring for document content."""
 
+import math
 import re
+from bisect import bisect_right
+from collections.abc import Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
+from .parsing import ParsedContent, parse_content
+
 logger = structlog.get_logger()
 
+# Markdown constructs counted in a single left-to-right scan; each span of
+# text is attributed to the first alternative that matches it
+_STRUCTURE_RE = re.compile(
+    r"(?P<code_block>```[\s\S]*?```)"
+    r"|(?P<inline_code>`[^`]+`)"
+    r"|(?P<link>\[[^\]]+\]\([^\)]+\))"
+    r"|(?P<bullet>^[-*+]\s+)"
+    r"|(?P<numbered>^\d+\.\s+)"
+    r"|(?P<bold>\*\*[^*]+\*\*)"
+    r"|(?P<italic>\*[^*]+\*)",
+    re.MULTILINE,
+)
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+_SENTENCE_END_TO_SPACE = str.maketrans(".!?", "   ")
+
+_SECONDS_PER_DAY = 86400
+
+# Score ladders as (bounds, scores) tables for _bucket_score; a value equal
+# to a bound belongs to the bucket above it
+_WORD_COUNT_BUCKETS = ((50, 100, 5001, 10001), (0.0, 0.1, 0.2, 0.1, 0.0))
+_AGE_DAYS_BUCKETS = ((31, 91, 181, 366), (1.0, 0.8, 0.6, 0.4, 0.2))
+_LONG_WORD_RATIO_BUCKETS = ((0.05, 0.1), (0.2, 0.1, 0.0))
+# Optimal range is 15-25 words per sentence; the upper bounds 25, 35 and 50
+# are inclusive, so the next float above each is the bucket boundary
+_SENTENCE_LENGTH_BUCKETS = (
+    (
+        5,
+        10,
+        15,
+        math.nextafter(25, math.inf),
+        math.nextafter(35, math.inf),
+        math.nextafter(50, math.inf),
+    ),
+    (0.0, 0.1, 0.2, 0.3, 0.2, 0.1, 0.0),
+)
+
+
+def _bucket_score(
+    value: float, buckets: tuple[tuple[float, ...], tuple[float, ...]]
+) -> float:
+    """Look up the score of the bucket containing value."""
+    bounds, scores = buckets
+    return scores[bisect_right(bounds, value)]
+
+
+def _count_structure(content: str) -> dict[str, int]:
+    """Count markdown constructs in one pass over the content.
+
+    Args:
+        content: Document content text
+
+    Returns:
+        Dictionary mapping construct names (the named groups of
+        _STRUCTURE_RE) to their number of occurrences
+    """
+    counts = dict.fromkeys(_STRUCTURE_RE.groupindex, 0)
+    for match in _STRUCTURE_RE.finditer(content):
+        # Every alternative of the pattern is a named group
+        group = match.lastgroup
+        assert group is not None
+        counts[group] += 1
+    return counts
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> float:
+    """Parse an ISO 8601 timestamp to epoch seconds (naive values are UTC).
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    parsed = datetime.fromisoformat(value)  # Accepts a trailing "Z" on 3.11+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
 
 class QualityScorer:
     """Scores document quality based on completeness, freshness, and clarity."""
@@ -23,19 +105,65 @@ class QualityScorer:
         self.freshness_weight = self.config.get("freshness_weight", 0.3)
         self.clarity_weight = self.config.get("clarity_weight", 0.3)
 
-    def score_quality(self, content: str, metadata: dict[str, Any]) -> dict[str, float]:
+        # Reference time for freshness, fixed for the lifetime of the scorer
+        self._now = datetime.now(UTC).timestamp()
+
+    def score_quality(
+        self,
+        content: str,
+        metadata: dict[str, Any],
+        parsed: ParsedContent | None = None,
+    ) -> dict[str, float]:
         """Score document quality across multiple dimensions.
 
         Args:
             content: Document content text
             metadata: Document metadata dictionary
+            parsed: Optional pre-parsed content shared with other analyzers
 
         Returns:
             Dictionary with quality scores and overall score
         """
-        completeness = self._score_completeness(content, metadata)
+        if parsed is None:
+            parsed = parse_content(content)
+
+        quality_metrics = self._score(content, metadata, parsed)
+
+        logger.debug("Quality scoring complete", **quality_metrics)
+
+        return quality_metrics
+
+    def score_batch(
+        self, documents: Iterable[tuple[str, dict[str, Any]]]
+    ) -> list[dict[str, float]]:
+        """Score the quality of a batch of documents.
+
+        Emits one summary log event for the batch instead of one per document.
+
+        Args:
+            documents: (content, metadata) pairs
+
+        Returns:
+            Quality metrics for each document, in input order
+        """
+        results = [
+            self._score(content, metadata, parse_content(content))
+            for content, metadata in documents
+        ]
+
+        logger.debug("Batch quality scoring complete", documents=len(results))
+
+        return results
+
+    def _score(
+        self, content: str, metadata: dict[str, Any], parsed: ParsedContent
+    ) -> dict[str, float]:
+        """Compute the quality metrics of one document."""
+        structure = _count_structure(content)
+
+        completeness = self._score_completeness(content, metadata, parsed, structure)
         freshness = self._score_freshness(metadata)
-        clarity = self._score_clarity(content)
+        clarity = self._score_clarity(content, parsed, structure)
 
         # Calculate weighted overall score
         overall = (
@@ -44,19 +172,26 @@ class QualityScorer:
             + clarity * self.clarity_weight
         )
 
-        quality_metrics = {
+        return {
             "completeness": round(completeness, 2),
             "freshness": round(freshness, 2),
             "clarity": round(clarity, 2),
             "overall": round(overall, 2),
         }
 
-        logger.debug("Quality scoring complete", **quality_metrics)
-
-        return quality_metrics
-
-    def _score_completeness(self, content: str, metadata: dict[str, Any]) -> float:
+    def _score_completeness(
+        self,
+        content: str,
+        metadata: dict[str, Any],
+        parsed: ParsedContent | None = None,
+        structure: dict[str, int] | None = None,
+    ) -> float:
         """Score document completeness based on structure and content."""
+        if parsed is None:
+            parsed = parse_content(content)
+        if structure is None:
+            structure = _count_structure(content)
+
         score = 0.0
 
         # Check for title
@@ -64,30 +199,24 @@ class QualityScorer:
             score += 0.2
 
         # Check for headings structure
-        headings = re.findall(r"^#+\s+(.+)$", content, re.MULTILINE)
+        headings = parsed.headings
         if len(headings) >= 2:
             score += 0.3
         elif len(headings) >= 1:
             score += 0.15
 
         # Check content length (not too short, not extremely long)
-        word_count = len(content.split())
-        if 100 <= word_count <= 5000:
-            score += 0.2
-        elif 50 <= word_count < 100 or 5000 < word_count <= 10000:
-            score += 0.1
+        score += _bucket_score(len(parsed.words), _WORD_COUNT_BUCKETS)
 
         # Check for code examples
-        code_blocks = re.findall(r"```[\s\S]*?```", content)
-        inline_code = re.findall(r"`[^`]+`", content)
-        if code_blocks or len(inline_code) >= 3:
+        if structure["code_block"] or structure["inline_code"] >= 3:
             score += 0.15
 
         # Check for links (external references)
-        links = re.findall(r"\[([^\]]+)\]\([^\)]+\)", content)
-        if len(links) >= 2:
+        links = structure["link"]
+        if links >= 2:
             score += 0.15
-        elif len(links) >= 1:
+        elif links >= 1:
             score += 0.1
 
         return min(score, 1.0)
@@ -101,34 +230,28 @@ class QualityScorer:
                 return 0.5  # Unknown freshness
 
             # Parse timestamp
-            if fetched_at_str.endswith("Z"):
-                fetched_at_str = fetched_at_str[:-1] + "+00:00"
-
-            fetched_at = datetime.fromisoformat(fetched_at_str)
-            if fetched_at.tzinfo is None:
-                fetched_at = fetched_at.replace(tzinfo=UTC)
-
-            now = datetime.now(UTC)
-            days_old = (now - fetched_at).days
-
-            # Score based on age
-            if days_old <= 30:
-                return 1.0  # Very fresh
-            elif days_old <= 90:
-                return 0.8  # Fresh
-            elif days_old <= 180:
-                return 0.6  # Moderately fresh
-            elif days_old <= 365:
-                return 0.4  # Aging
-            else:
-                return 0.2  # Old
+            fetched_at = _parse_timestamp(fetched_at_str)
+            days_old = int((self._now - fetched_at) // _SECONDS_PER_DAY)
+
+            # Score based on age: very fresh (30 days) down to old (over a year)
+            return _bucket_score(days_old, _AGE_DAYS_BUCKETS)
 
         except Exception as e:
             logger.debug("Failed to parse freshness timestamp", error=str(e))
             return 0.5  # Unknown freshness
 
-    def _score_clarity(self, content: str) -> float:
+    def _score_clarity(
+        self,
+        content: str,
+        parsed: ParsedContent | None = None,
+        structure: dict[str, int] | None = None,
+    ) -> float:
         """Score document clarity based on readability metrics."""
+        if parsed is None:
+            parsed = parse_content(content)
+        if structure is None:
+            structure = _count_structure(content)
+
         score = 0.0
 
         # Check for clear paragraph structure
@@ -139,44 +262,36 @@ class QualityScorer:
             score += 0.1
 
         # Check for reasonable sentence length
-        sentences = re.split(r"[.!?]+", content)
-        sentence_lengths = [len(s.split()) for s in sentences if s.strip()]
-
-        if sentence_lengths:
-            avg_sentence_length = sum(sentence_lengths) / len(sentence_lengths)
-            # Optimal range is 15-25 words per sentence
-            if 15 <= avg_sentence_length <= 25:
-                score += 0.3
-            elif 10 <= avg_sentence_length < 15 or 25 < avg_sentence_length <= 35:
-                score += 0.2
-            elif 5 <= avg_sentence_length < 10 or 35 < avg_sentence_length <= 50:
-                score += 0.1
+        # Sentences are the non-blank pieces between runs of .!? and their
+        # words are the runs of text between whitespace and punctuation
+        sentence_count = sum(
+            1 for s in _SENTENCE_SPLIT_RE.split(content) if s and not s.isspace()
+        )
+
+        if sentence_count:
+            word_total = len(content.translate(_SENTENCE_END_TO_SPACE).split())
+            avg_sentence_length = word_total / sentence_count
+            score += _bucket_score(avg_sentence_length, _SENTENCE_LENGTH_BUCKETS)
 
         # Check for lists and structured content
-        bullet_lists = re.findall(r"^[-*+]\s+", content, re.MULTILINE)
-        numbered_lists = re.findall(r"^\d+\.\s+", content, re.MULTILINE)
+        bullet_lists = structure["bullet"]
+        numbered_lists = structure["numbered"]
 
-        if len(bullet_lists) >= 3 or len(numbered_lists) >= 3:
+        if bullet_lists >= 3 or numbered_lists >= 3:
             score += 0.2
-        elif len(bullet_lists) >= 1 or len(numbered_lists) >= 1:
+        elif bullet_lists >= 1 or numbered_lists >= 1:
             score += 0.1
 
         # Check for excessive complexity indicators
         # Penalize very long words or excessive jargon
-        words = content.split()
-        long_words = [w for w in words if len(w) > 12]
-        long_word_ratio = len(long_words) / len(words) if words else 0
+        words = parsed.words
+        long_words = sum(1 for w in words if len(w) > 12)
+        long_word_ratio = long_words / len(words) if words else 0
 
-        if long_word_ratio < 0.05:  # Less than 5% long words
-            score += 0.2
-        elif long_word_ratio < 0.1:  # Less than 10% long words
-            score += 0.1
+        score += _bucket_score(long_word_ratio, _LONG_WORD_RATIO_BUCKETS)
 
         # Check for good use of formatting
-        bold_text = re.findall(r"\*\*[^*]+\*\*", content)
-        italic_text = re.findall(r"\*[^*]+\*", content)
-
-        if len(bold_text) >= 2 or len(italic_text) >= 2:
+        if structure["bold"] >= 2 or structure["italic"] >= 2:
             score += 0.1
 
         return min(score, 1.0)
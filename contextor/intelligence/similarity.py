@@ -1,14 +1,225 @@
 """Document similarity analysis and duplicate detection."""
 
 import hashlib
+import heapq
+import operator
+import random
 import re
+import struct
+import zlib
 from collections import Counter
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
+try:
+    import numpy as np
+
+    _HAVE_NUMPY = True
+except ImportError:  # Optional: installed with the "intelligence" extra
+    _HAVE_NUMPY = False
+
+try:
+    from scipy import sparse
+
+    _HAVE_SCIPY = True
+except ImportError:  # Optional: installed with the "intelligence" extra
+    _HAVE_SCIPY = False
+
 logger = structlog.get_logger()
 
+# Rows of the document-term matrix multiplied per block, bounding the
+# memory of the (dense-ish) similarity block to _SIMILARITY_BLOCK_ROWS x N
+_SIMILARITY_BLOCK_ROWS = 256
+
+# Columns of the hashed document-term matrix; words are mapped to columns by
+# a stable CRC-32 hash instead of through a vocabulary dict (the "hashing
+# trick"). The built-in hash() is salted per process, so it is not used
+_HASH_BUCKETS = 1 << 18
+_HASH_MASK = _HASH_BUCKETS - 1
+
+# Content normalization patterns
+_MARKDOWN_STRIP_TABLE = str.maketrans("", "", "*_#>`-")
+_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_RE = re.compile(r"[^\w\s.]")
+# Spans dropped from vector content in a single pass: code blocks, inline
+# code, link targets (group 1 keeps the link text) and HTML tags
+_VECTOR_CLEAN_RE = re.compile(r"```[\s\S]*?```|`[^`]+`|\[([^\]]+)\]\([^\)]+\)|<[^>]+>")
+_WORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+
+# Common words excluded from content vectors
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "and",
+        "for",
+        "are",
+        "but",
+        "not",
+        "you",
+        "all",
+        "can",
+        "had",
+        "her",
+        "was",
+        "one",
+        "our",
+        "out",
+        "day",
+        "get",
+        "has",
+        "him",
+        "his",
+        "how",
+        "its",
+        "may",
+        "new",
+        "now",
+        "old",
+        "see",
+        "two",
+        "who",
+        "boy",
+        "did",
+        "use",
+        "way",
+        "she",
+        "oil",
+        "sit",
+        "set",
+        "run",
+        "eat",
+        "far",
+        "sea",
+        "eye",
+        "ask",
+        "own",
+        "say",
+        "too",
+        "any",
+        "try",
+        "let",
+        "put",
+    }
+)
+
+# Fingerprints are non-cryptographic identifiers, so a short BLAKE2b digest
+# replaces the truncated SHA-256 at the same 16 hex character width
+FINGERPRINT_BYTES = 8
+
+# MinHash signatures: number of 32-bit lanes, word shingle length, and the
+# Mersenne prime modulus of the hash family h(x) = (a * x + b) mod p. With a
+# 31-bit prime and 32-bit shingle hashes, a * x + b fits in a uint64, so the
+# NumPy and pure-Python paths compute identical signatures
+MINHASH_PERMUTATIONS = 64
+MINHASH_SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 31) - 1
+
+# Shingle hashes permuted per NumPy block, bounding the block to
+# num_perm x _MINHASH_BLOCK uint64 values
+_MINHASH_BLOCK = 4096
+
+
+@lru_cache(maxsize=8)
+def _minhash_permutations(num_perm: int) -> tuple[tuple[int, int], ...]:
+    """Return (a, b) coefficients for num_perm hash functions.
+
+    A fixed seed keeps signatures comparable across runs and processes.
+    """
+    rng = random.Random(num_perm)
+    return tuple(
+        (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+        for _ in range(num_perm)
+    )
+
+
+def _minhash_signature_numpy(
+    hashes: list[int], permutations: tuple[tuple[int, int], ...]
+) -> list[int]:
+    """Apply every permutation to the shingle hashes as uint64 array ops."""
+    values = np.asarray(hashes, dtype=np.uint64)
+    a = np.asarray([p[0] for p in permutations], dtype=np.uint64)[:, None]
+    b = np.asarray([p[1] for p in permutations], dtype=np.uint64)[:, None]
+    prime = np.uint64(_MERSENNE_PRIME)
+
+    # Every permuted value is below the prime, so it is a safe starting minimum
+    signature = np.full(len(permutations), prime, dtype=np.uint64)
+    for start in range(0, len(values), _MINHASH_BLOCK):
+        block = values[start : start + _MINHASH_BLOCK]
+        np.minimum(signature, ((a * block + b) % prime).min(axis=1), out=signature)
+    return [int(value) for value in signature]
+
+
+def decode_minhash(signature: str) -> tuple[int, ...]:
+    """Decode a hex-encoded MinHash signature into its 32-bit lanes.
+
+    Args:
+        signature: Hex-encoded signature from generate_minhash
+
+    Returns:
+        Lane values, empty if the signature is missing or malformed
+    """
+    try:
+        raw = bytes.fromhex(signature)
+        return struct.unpack(f">{len(raw) // 4}I", raw)
+    except (ValueError, struct.error):
+        return ()
+
+
+def minhash_lane_similarity(lanes1: tuple[int, ...], lanes2: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity as the fraction of equal MinHash lanes.
+
+    Args:
+        lanes1: Signature lanes from decode_minhash
+        lanes2: Signature lanes from decode_minhash
+
+    Returns:
+        Estimated Jaccard similarity (0-1), or 0.0 if the signatures
+        are missing or were generated with different lane counts
+    """
+    if not lanes1 or len(lanes1) != len(lanes2):
+        return 0.0
+
+    return sum(map(operator.eq, lanes1, lanes2)) / len(lanes1)
+
+
+def minhash_similarity(signature1: str, signature2: str) -> float:
+    """Estimate Jaccard similarity of two hex-encoded MinHash signatures.
+
+    Args:
+        signature1: Hex-encoded signature from generate_minhash
+        signature2: Hex-encoded signature from generate_minhash
+
+    Returns:
+        Estimated Jaccard similarity (0-1)
+    """
+    return minhash_lane_similarity(
+        decode_minhash(signature1), decode_minhash(signature2)
+    )
+
+
+def _magnitude(vector: Counter[str]) -> float:
+    """Euclidean norm of a word-count vector."""
+    return float(sum(count * count for count in vector.values()) ** 0.5)
+
+
+def _cosine(
+    vector1: Counter[str], vector2: Counter[str], norm1: float, norm2: float
+) -> float:
+    """Cosine similarity given precomputed norms, clamped to [0, 1]."""
+    if not norm1 or not norm2:
+        return 0.0
+
+    # Walk the smaller vector and probe the larger one
+    if len(vector1) > len(vector2):
+        vector1, vector2 = vector2, vector1
+    get = vector2.get
+    dot_product = sum(count * get(word, 0) for word, count in vector1.items())
+
+    return max(0.0, min(1.0, dot_product / (norm1 * norm2)))
+
 
 class SimilarityAnalyzer:
     """Analyzes document similarity and detects duplicates."""
@@ -22,6 +233,10 @@ class SimilarityAnalyzer:
         self.config = config or {}
         self.similarity_threshold = self.config.get("similarity_threshold", 0.8)
         self.duplicate_threshold = self.config.get("duplicate_threshold", 0.95)
+        self.max_similar_documents = self.config.get("max_similar_documents")
+        self.minhash_permutations = self.config.get(
+            "minhash_permutations", MINHASH_PERMUTATIONS
+        )
 
     def generate_fingerprint(self, content: str) -> str:
         """Generate a content fingerprint for similarity comparison.
@@ -35,8 +250,48 @@ class SimilarityAnalyzer:
         # Normalize content for fingerprinting
         normalized = self._normalize_content(content)
 
-        # Generate hash
-        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        # Generate hash (8-byte BLAKE2b digest, 16 hex chars)
+        return hashlib.blake2b(
+            normalized.encode(), digest_size=FINGERPRINT_BYTES
+        ).hexdigest()
+
+    def generate_minhash(self, content: str, num_perm: int | None = None) -> str:
+        """Generate a MinHash signature of the content's word shingles.
+
+        The fraction of equal lanes between two signatures estimates the
+        Jaccard similarity of the documents' shingle sets.
+
+        Args:
+            content: Document content text
+            num_perm: Number of 32-bit lanes (defaults to minhash_permutations)
+
+        Returns:
+            Hex-encoded signature (8 characters per lane), empty for empty content
+        """
+        words = self._normalize_content(content).split()
+        if not words:
+            return ""
+
+        size = MINHASH_SHINGLE_SIZE
+        shingles = {
+            " ".join(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))
+        }
+
+        # Hash each shingle once; the permutations are then cheap integer ops
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest())
+            for s in shingles
+        ]
+        permutations = _minhash_permutations(num_perm or self.minhash_permutations)
+
+        if _HAVE_NUMPY:
+            signature = _minhash_signature_numpy(hashes, permutations)
+        else:
+            signature = [
+                min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+                for a, b in permutations
+            ]
+        return "".join(f"{value:08x}" for value in signature)
 
     def find_similar_documents(
         self, documents: list[dict[str, Any]]
@@ -49,46 +304,43 @@ class SimilarityAnalyzer:
         Returns:
             Dictionary mapping document slugs to lists of similar documents
         """
-        similarities = {}
-
         # Generate content vectors for all documents
-        doc_vectors = {}
-        for doc in documents:
-            vector = self._generate_content_vector(doc["content"])
-            doc_vectors[doc["slug"]] = vector
+        vectors = [self._generate_content_vector(doc["content"]) for doc in documents]
 
         # Compare all pairs of documents
-        for i, doc1 in enumerate(documents):
-            similar_docs = []
-
-            for j, doc2 in enumerate(documents):
-                if i >= j:  # Skip self and already compared pairs
-                    continue
+        if _HAVE_SCIPY and len(vectors) > 1:
+            pairs = self._similar_pairs_sparse(vectors)
+        else:
+            pairs = self._similar_pairs(vectors)
+
+        similar_by_index: dict[int, list[dict[str, Any]]] = {}
+        for i, j, similarity in pairs:
+            doc2 = documents[j]
+            relationship_type = (
+                "duplicate" if similarity >= self.duplicate_threshold else "similar"
+            )
+
+            similar_by_index.setdefault(i, []).append(
+                {
+                    "slug": doc2["slug"],
+                    "title": doc2["title"],
+                    "similarity": round(similarity, 3),
+                    "relationship": relationship_type,
+                }
+            )
 
-                similarity = self._calculate_similarity(
-                    doc_vectors[doc1["slug"]], doc_vectors[doc2["slug"]]
+        similarities = {}
+        for i, similar_docs in similar_by_index.items():
+            # Sort by similarity score, keeping only the top matches if limited
+            if self.max_similar_documents is not None:
+                similar_docs = heapq.nlargest(
+                    self.max_similar_documents,
+                    similar_docs,
+                    key=lambda x: x["similarity"],
                 )
-
-                if similarity >= self.similarity_threshold:
-                    relationship_type = (
-                        "duplicate"
-                        if similarity >= self.duplicate_threshold
-                        else "similar"
-                    )
-
-                    similar_docs.append(
-                        {
-                            "slug": doc2["slug"],
-                            "title": doc2["title"],
-                            "similarity": round(similarity, 3),
-                            "relationship": relationship_type,
-                        }
-                    )
-
-            if similar_docs:
-                # Sort by similarity score
+            else:
                 similar_docs.sort(key=lambda x: x["similarity"], reverse=True)
-                similarities[doc1["slug"]] = similar_docs
+            similarities[documents[i]["slug"]] = similar_docs
 
         logger.debug(
             "Similarity analysis complete",
@@ -98,19 +350,79 @@ class SimilarityAnalyzer:
 
         return similarities
 
+    def _similar_pairs(
+        self, vectors: list[Counter[str]]
+    ) -> Iterator[tuple[int, int, float]]:
+        """Yield (i, j, similarity) for i < j pairs above the threshold."""
+        # Magnitudes are computed once per document, not once per pair
+        norms = [_magnitude(vector) for vector in vectors]
+
+        for i, vector1 in enumerate(vectors):
+            norm1 = norms[i]
+            if not norm1:
+                continue
+
+            for j in range(i + 1, len(vectors)):
+                similarity = _cosine(vector1, vectors[j], norm1, norms[j])
+                if similarity >= self.similarity_threshold:
+                    yield i, j, similarity
+
+    def _similar_pairs_sparse(
+        self, vectors: list[Counter[str]]
+    ) -> Iterator[tuple[int, int, float]]:
+        """Yield similar pairs using a sparse L2-normalized term matrix.
+
+        Cosine similarity for every pair is the product X @ X.T of the
+        row-normalized document-term matrix, computed block by block.
+        Words are hashed into _HASH_BUCKETS columns, so no vocabulary is
+        built; rare bucket collisions only nudge the scores, and the same
+        in every run.
+        """
+        indptr = [0]
+        indices: list[int] = []
+        data: list[int] = []
+
+        for vector in vectors:
+            indices.extend(zlib.crc32(word.encode()) & _HASH_MASK for word in vector)
+            data.extend(vector.values())
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), indices, indptr),
+            shape=(len(vectors), _HASH_BUCKETS),
+        )
+        matrix.sum_duplicates()  # Merge words that collided in one bucket
+
+        # L2-normalize rows so dot products are cosine similarities
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        matrix = sparse.csr_matrix(sparse.diags(1.0 / norms) @ matrix)
+        transposed = matrix.T.tocsr()
+
+        for start in range(0, len(vectors), _SIMILARITY_BLOCK_ROWS):
+            block = sparse.csr_matrix(
+                matrix[start : start + _SIMILARITY_BLOCK_ROWS] @ transposed
+            )
+            block.sort_indices()  # Yield pairs in (i, j) order like the loop
+            block = block.tocoo()
+            for row, col, value in zip(block.row, block.col, block.data, strict=True):
+                i = start + int(row)
+                if i < col and value >= self.similarity_threshold:
+                    yield i, int(col), min(1.0, float(value))
+
     def _normalize_content(self, content: str) -> str:
         """Normalize content for consistent fingerprinting."""
         # Convert to lowercase
         normalized = content.lower()
 
         # Remove markdown formatting
-        normalized = re.sub(r"[*_#>`-]", "", normalized)
+        normalized = normalized.translate(_MARKDOWN_STRIP_TABLE)
 
         # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized)
+        normalized = _WHITESPACE_RE.sub(" ", normalized)
 
         # Remove punctuation except periods
-        normalized = re.sub(r"[^\w\s.]", "", normalized)
+        normalized = _PUNCTUATION_RE.sub("", normalized)
 
         return normalized.strip()
 
@@ -123,89 +435,21 @@ class SimilarityAnalyzer:
         Returns:
             Counter with word frequencies
         """
-        # Clean content
+        # Content is lowercased while cleaning, so words need no further folding
         cleaned = self._clean_content_for_vector(content)
 
-        # Extract words (3+ characters)
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", cleaned.lower())
-
-        # Filter common stop words
-        stop_words = {
-            "the",
-            "and",
-            "for",
-            "are",
-            "but",
-            "not",
-            "you",
-            "all",
-            "can",
-            "had",
-            "her",
-            "was",
-            "one",
-            "our",
-            "out",
-            "day",
-            "get",
-            "has",
-            "him",
-            "his",
-            "how",
-            "its",
-            "may",
-            "new",
-            "now",
-            "old",
-            "see",
-            "two",
-            "who",
-            "boy",
-            "did",
-            "use",
-            "way",
-            "she",
-            "oil",
-            "sit",
-            "set",
-            "run",
-            "eat",
-            "far",
-            "sea",
-            "eye",
-            "ask",
-            "own",
-            "say",
-            "too",
-            "any",
-            "try",
-            "let",
-            "put",
-        }
-
-        filtered_words = [w for w in words if w not in stop_words and len(w) > 2]
-
-        return Counter(filtered_words)
+        # Extract words (3+ characters), dropping common stop words
+        return Counter(
+            word for word in _WORD_RE.findall(cleaned) if word not in _STOP_WORDS
+        )
 
     def _clean_content_for_vector(self, content: str) -> str:
-        """Clean content for vector generation."""
-        # Remove code blocks
-        content = re.sub(r"```[\s\S]*?```", " ", content)
-        content = re.sub(r"`[^`]+`", " ", content)
+        """Clean and lowercase content for vector generation.
 
-        # Remove links but keep link text
-        content = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", content)
-
-        # Remove HTML tags
-        content = re.sub(r"<[^>]+>", " ", content)
-
-        # Remove markdown headers but keep text
-        content = re.sub(r"^#+\s*", "", content, flags=re.MULTILINE)
-
-        # Normalize whitespace
-        content = re.sub(r"\s+", " ", content)
-
-        return content.strip()
+        Only word tokens are extracted from the result, so heading markers
+        and whitespace runs are left in place.
+        """
+        return _VECTOR_CLEAN_RE.sub(r" \1 ", content.lower())
 
     def _calculate_similarity(
         self, vector1: Counter[str], vector2: Counter[str]
@@ -222,23 +466,4 @@ class SimilarityAnalyzer:
         if not vector1 or not vector2:
             return 0.0
 
-        # Get intersection of words
-        common_words = set(vector1.keys()) & set(vector2.keys())
-
-        if not common_words:
-            return 0.0
-
-        # Calculate dot product
-        dot_product = sum(vector1[word] * vector2[word] for word in common_words)
-
-        # Calculate magnitudes
-        magnitude1 = sum(count**2 for count in vector1.values()) ** 0.5
-        magnitude2 = sum(count**2 for count in vector2.values()) ** 0.5
-
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
-
-        # Calculate cosine similarity
-        similarity = dot_product / (magnitude1 * magnitude2)
-
-        return max(0.0, min(1.0, similarity))  # Clamp to [0, 1]
+        return _cosine(vector1, vector2, _magnitude(vector1), _magnitude(vector2))
@@ -2,12 +2,208 @@
 
 import re
 from collections import Counter
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from itertools import chain
 from typing import Any
 
 import structlog
 
+try:
+    import ahocorasick
+
+    _HAVE_AHOCORASICK = True
+except ImportError:  # Optional: multi-pattern counting falls back to str.count
+    _HAVE_AHOCORASICK = False
+
+from .parsing import ParsedContent, parse_content
+
 logger = structlog.get_logger()
 
+_EXTENSION_RE = re.compile(r"\.[^.]+$")
+# Path separators ("-", "_") become spaces so str.split tokenizes path parts
+_PATH_SEPARATOR_TABLE = str.maketrans("-_", "  ")
+_HEADING_PUNCTUATION_RE = re.compile(r"[^\w\s-]")
+_WORD_RE = re.compile(r"\b[a-zA-Z]{3,}\b")
+# Spans removed before keyword analysis in a single pass: code blocks,
+# inline code, link targets (group 1 keeps the link text) and HTML tags
+_ANALYSIS_CLEAN_RE = re.compile(
+    r"```[\s\S]*?```|`[^`]+`|\[([^\]]+)\]\([^\)]+\)|<[^>]+>"
+)
+_MARKDOWN_FORMAT_TABLE = str.maketrans("*_#>-", "     ")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _count_occurrences(text: str, needles: set[str]) -> dict[str, int]:
+    """Count non-overlapping occurrences of each needle in text.
+
+    Matches str.count. With pyahocorasick installed, all needles are
+    counted in a single scan of text instead of one scan per needle.
+    """
+    if not _HAVE_AHOCORASICK or len(needles) < 2:
+        return {needle: text.count(needle) for needle in needles}
+
+    automaton = ahocorasick.Automaton()
+    counts = {}
+    for needle in needles:
+        if needle:
+            automaton.add_word(needle, needle)
+            counts[needle] = 0
+        else:
+            counts[needle] = text.count(needle)
+    automaton.make_automaton()
+
+    # The automaton reports overlapping matches; like str.count, only count
+    # a match that starts after the previous counted match of that needle
+    last_end = dict.fromkeys(counts, -1)
+    for end, needle in automaton.iter(text):
+        if end - len(needle) >= last_end[needle]:
+            counts[needle] += 1
+            last_end[needle] = end
+
+    return counts
+
+
+class _HeadingPunctuationTable(dict[int, int]):
+    """str.translate table mapping _HEADING_PUNCTUATION_RE characters to spaces.
+
+    The Unicode word class is too large to enumerate up front, so each
+    character is classified with the regex the first time it is seen.
+    """
+
+    def __missing__(self, char: int) -> int:
+        value = 32 if _HEADING_PUNCTUATION_RE.match(chr(char)) else char
+        self[char] = value
+        return value
+
+
+_HEADING_PUNCTUATION_TABLE = _HeadingPunctuationTable()
+
+
+# Common stop words to filter out, shared by all extractors
+_STOP_WORDS: frozenset[str] = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "from",
+        "up",
+        "about",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "between",
+        "among",
+        "against",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "must",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+        "i",
+        "you",
+        "he",
+        "she",
+        "it",
+        "we",
+        "they",
+        "me",
+        "him",
+        "her",
+        "us",
+        "them",
+        "my",
+        "your",
+        "his",
+        "its",
+        "our",
+        "their",
+        "all",
+        "any",
+        "both",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "just",
+        "now",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "what",
+        "which",
+        "who",
+        "whom",
+        "whose",
+        "if",
+        "then",
+        "else",
+    }
+)
+
+
+@lru_cache(maxsize=4096)
+def _split_path_part(part: str) -> tuple[str, ...]:
+    """Split one path component into topic words.
+
+    Memoized, since the same directory names recur across every file of a
+    tree.
+    """
+    # Remove file extension, then split on common separators
+    words = _EXTENSION_RE.sub("", part).lower().translate(_PATH_SEPARATOR_TABLE).split()
+    return tuple(word for word in words if len(word) > 2 and word not in _STOP_WORDS)
+
 
 class TopicExtractor:
     """Extracts topics from document content using keywords and headings."""
@@ -21,149 +217,50 @@ class TopicExtractor:
         self.config = config or {}
         self.max_topics = self.config.get("max_topics", 10)
         self.min_topic_frequency = self.config.get("min_frequency", 2)
+        # Shorter documents (stubs, generated index pages) only get the
+        # topics declared in their metadata
+        self.min_content_length = self.config.get("min_content_length", 64)
 
         # Common stop words to filter out
-        self.stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "up",
-            "about",
-            "into",
-            "through",
-            "during",
-            "before",
-            "after",
-            "above",
-            "below",
-            "between",
-            "among",
-            "against",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-            "i",
-            "you",
-            "he",
-            "she",
-            "it",
-            "we",
-            "they",
-            "me",
-            "him",
-            "her",
-            "us",
-            "them",
-            "my",
-            "your",
-            "his",
-            "its",
-            "our",
-            "their",
-            "all",
-            "any",
-            "both",
-            "each",
-            "few",
-            "more",
-            "most",
-            "other",
-            "some",
-            "such",
-            "no",
-            "nor",
-            "not",
-            "only",
-            "own",
-            "same",
-            "so",
-            "than",
-            "too",
-            "very",
-            "just",
-            "now",
-            "here",
-            "there",
-            "when",
-            "where",
-            "why",
-            "how",
-            "what",
-            "which",
-            "who",
-            "whom",
-            "whose",
-            "if",
-            "then",
-            "else",
-        }
-
-    def extract_topics(self, content: str, metadata: dict[str, Any]) -> list[str]:
+        self.stop_words = _STOP_WORDS
+
+    def extract_topics(
+        self,
+        content: str,
+        metadata: dict[str, Any],
+        parsed: ParsedContent | None = None,
+    ) -> list[str]:
         """Extract topics from document content and metadata.
 
         Args:
             content: Document content text
             metadata: Document metadata dictionary
+            parsed: Optional pre-parsed content shared with other analyzers
 
         Returns:
             List of extracted topic strings
         """
-        topics = set()
-
-        # Extract from path-based topics
-        path_topics = self._extract_from_path(
-            metadata.get("source", {}).get("path", "")
+        if len(content) < self.min_content_length:
+            return list(metadata.get("topics", []))[: self.max_topics]
+
+        if parsed is None:
+            parsed = parse_content(content)
+
+        # Collect candidates from path, headings, content keywords and
+        # metadata, deduplicating as they are produced
+        topics = set(
+            chain(
+                self._iter_path_topics(metadata.get("source", {}).get("path", "")),
+                self._iter_heading_topics(content, parsed.headings),
+                self._iter_keyword_topics(content),
+                self._iter_metadata_topics(metadata),
+            )
         )
-        topics.update(path_topics)
-
-        # Extract from headings
-        heading_topics = self._extract_from_headings(content)
-        topics.update(heading_topics)
-
-        # Extract from content keywords
-        keyword_topics = self._extract_from_keywords(content)
-        topics.update(keyword_topics)
-
-        # Extract from metadata
-        metadata_topics = self._extract_from_metadata(metadata)
-        topics.update(metadata_topics)
 
         # Filter and rank topics
-        filtered_topics = self._filter_and_rank_topics(list(topics), content)
+        filtered_topics = self._filter_and_rank_topics(
+            list(topics), content, parsed.headings
+        )
 
         logger.debug(
             "Extracted topics",
@@ -176,132 +273,138 @@ class TopicExtractor:
 
     def _extract_from_path(self, path: str) -> list[str]:
         """Extract topics from file path components."""
-        if not path:
-            return []
+        return list(self._iter_path_topics(path))
 
-        topics = []
+    def _iter_path_topics(self, path: str) -> Iterator[str]:
+        """Yield topics from file path components."""
+        if not path:
+            return
 
         # Split path and extract meaningful segments
-        path_parts = path.replace("\\", "/").split("/")
-
-        for part in path_parts:
-            # Remove file extension
-            part = re.sub(r"\.[^.]+$", "", part)
-
-            # Split on common separators and extract words
-            words = re.split(r"[-_\s]+", part.lower())
-
-            for word in words:
-                if len(word) > 2 and word not in self.stop_words:
-                    topics.append(word)
+        for part in path.replace("\\", "/").split("/"):
+            yield from _split_path_part(part)
 
-        return topics
-
-    def _extract_from_headings(self, content: str) -> list[str]:
+    def _extract_from_headings(
+        self, content: str, headings: Sequence[str] | None = None
+    ) -> list[str]:
         """Extract topics from markdown headings."""
-        topics = []
+        return list(self._iter_heading_topics(content, headings))
 
+    def _iter_heading_topics(
+        self, content: str, headings: Sequence[str] | None = None
+    ) -> Iterator[str]:
+        """Yield topics from markdown headings."""
         # Find all markdown headings
-        heading_pattern = r"^#+\s+(.+)$"
-        headings = re.findall(heading_pattern, content, re.MULTILINE)
+        if headings is None:
+            headings = parse_content(content).headings
 
         for heading in headings:
             # Clean heading text and extract keywords
-            cleaned = re.sub(r"[^\w\s-]", " ", heading.lower())
+            cleaned = heading.lower().translate(_HEADING_PUNCTUATION_TABLE)
             words = cleaned.split()
 
             for word in words:
                 if len(word) > 2 and word not in self.stop_words:
-                    topics.append(word)
-
-        return topics
+                    yield word
 
     def _extract_from_keywords(self, content: str) -> list[str]:
         """Extract topics from content keywords using frequency analysis."""
+        return list(self._iter_keyword_topics(content))
+
+    def _iter_keyword_topics(self, content: str) -> Iterator[str]:
+        """Yield content keywords that appear frequently enough."""
         # Clean content: remove code blocks, links, etc.
         cleaned_content = self._clean_content_for_analysis(content)
 
-        # Extract words
-        words = re.findall(r"\b[a-zA-Z]{3,}\b", cleaned_content.lower())
-
-        # Filter stop words and count frequency
-        filtered_words = [w for w in words if w not in self.stop_words]
-        word_freq = Counter(filtered_words)
+        # Count every word in C, then drop the few distinct stop words seen;
+        # cheaper than testing each occurrence against the stop list
+        word_freq = Counter(_WORD_RE.findall(cleaned_content.lower()))
+        for stop_word in self.stop_words.intersection(word_freq):
+            del word_freq[stop_word]
 
-        # Return words that appear frequently enough
-        topics = [
-            word for word, freq in word_freq.items() if freq >= self.min_topic_frequency
-        ]
-
-        return topics
+        # Yield words that appear frequently enough
+        min_frequency = self.min_topic_frequency
+        for word, freq in word_freq.items():
+            if freq >= min_frequency:
+                yield word
 
     def _extract_from_metadata(self, metadata: dict[str, Any]) -> list[str]:
         """Extract topics from document metadata."""
-        topics = []
+        return list(self._iter_metadata_topics(metadata))
 
+    def _iter_metadata_topics(self, metadata: dict[str, Any]) -> Iterator[str]:
+        """Yield topics from document metadata."""
         # Extract from existing topics
         existing_topics = metadata.get("topics", [])
         if existing_topics:
-            topics.extend(existing_topics)
+            yield from existing_topics
 
         # Extract from title
         title = metadata.get("title", "")
         if title:
-            title_words = re.findall(r"\b[a-zA-Z]{3,}\b", title.lower())
-            topics.extend([w for w in title_words if w not in self.stop_words])
-
-        return topics
+            for word in _WORD_RE.findall(title.lower()):
+                if word not in self.stop_words:
+                    yield word
 
     def _clean_content_for_analysis(self, content: str) -> str:
         """Clean content for keyword analysis."""
-        # Remove code blocks
-        content = re.sub(r"```[\s\S]*?```", " ", content)
-        content = re.sub(r"`[^`]+`", " ", content)
-
-        # Remove links
-        content = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", content)
+        # Remove code blocks, HTML tags and links (keeping the link text)
+        content = _ANALYSIS_CLEAN_RE.sub(r" \1 ", content)
 
         # Remove markdown formatting
-        content = re.sub(r"[*_#>-]", " ", content)
-
-        # Remove HTML tags
-        content = re.sub(r"<[^>]+>", " ", content)
+        content = content.translate(_MARKDOWN_FORMAT_TABLE)
 
         # Normalize whitespace
-        content = re.sub(r"\s+", " ", content)
+        content = _WHITESPACE_RE.sub(" ", content)
 
         return content.strip()
 
-    def _filter_and_rank_topics(self, topics: list[str], content: str) -> list[str]:
+    def _filter_and_rank_topics(
+        self,
+        topics: list[str],
+        content: str,
+        headings: Sequence[str] | None = None,
+    ) -> list[str]:
         """Filter and rank topics by relevance."""
         if not topics:
             return []
 
-        # Count topic frequency in content
-        content_lower = content.lower()
-        topic_scores = {}
+        if headings is None:
+            headings = parse_content(content).headings
+
+        # Lowercase each unique topic once and count them all in content
+        lowered = {topic: topic.lower() for topic in set(topics)}
+        frequencies = _count_occurrences(content.lower(), set(lowered.values()))
 
-        for topic in set(topics):  # Remove duplicates
-            # Count occurrences in content
-            frequency = content_lower.count(topic.lower())
+        # Lowercase the headings once; a single substring search over the
+        # joined text replaces a loop over headings for every topic
+        headings_lower = "\n".join(headings).lower()
+
+        topic_scores = {}
+        for topic, topic_lower in lowered.items():
+            frequency = frequencies[topic_lower]
+            if not frequency:
+                continue  # Scores zero whatever the boosts
 
             # Boost score for topics that appear in headings
-            heading_boost = 2 if self._appears_in_headings(topic, content) else 1
+            heading_boost = 2 if topic_lower in headings_lower else 1
 
             # Boost score for longer, more specific terms
             length_boost = min(len(topic) / 5, 2)
 
-            topic_scores[topic] = frequency * heading_boost * length_boost
+            score = frequency * heading_boost * length_boost
+            if score > 0:
+                topic_scores[topic] = score
 
         # Sort by score and return top topics
-        ranked_topics = sorted(topic_scores.items(), key=lambda x: x[1], reverse=True)
-
-        return [topic for topic, score in ranked_topics if score > 0]
+        return sorted(topic_scores, key=topic_scores.__getitem__, reverse=True)
 
-    def _appears_in_headings(self, topic: str, content: str) -> bool:
+    def _appears_in_headings(
+        self, topic: str, content: str, headings: Sequence[str] | None = None
+    ) -> bool:
         """Check if topic appears in any heading."""
-        heading_pattern = r"^#+\s+(.+)$"
-        headings = re.findall(heading_pattern, content, re.MULTILINE)
+        if headings is None:
+            headings = parse_content(content).headings
 
         for heading in headings:
             if topic.lower() in heading.lower():
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import fnmatch
-from collections.abc import Iterator
+import os
+import re
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path, PurePath
 from typing import Any
 
 import frontmatter
@@ -13,6 +19,57 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Documents can only carry front-matter if, after leading whitespace, they
+# open with a YAML ("---"), TOML ("+++") or JSON ("{") delimiter
+_FRONTMATTER_START_RE = re.compile(r"\s*(?:---|\+\+\+|\{)")
+
+# Extensions of the documents to load, matched case-insensitively
+_MD_SUFFIXES = (".md", ".mdx")
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Build a matcher for a glob pattern, supporting ** wildcards."""
+    # Use pathlib for patterns with **
+    if "**" in pattern:
+
+        def match_recursive(path_str: str) -> bool:
+            try:
+                return PurePath(path_str).match(pattern)
+            except Exception:
+                # Fallback to fnmatch if Path.match fails
+                return fnmatch.fnmatch(path_str, pattern)
+
+        return match_recursive
+
+    # Simple patterns are translated to a regex once, as fnmatch would
+    regex = re.compile(fnmatch.translate(os.path.normcase(pattern)))
+    return lambda path_str: regex.match(os.path.normcase(path_str)) is not None
+
+
+@lru_cache(maxsize=64)
+def _compile_patterns(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    """Build one matcher that checks a path against any of several patterns.
+
+    Simple patterns are joined into a single union regex, so a path is
+    tested against all of them in one match; ** patterns keep their own
+    matchers.
+    """
+    simple = [p for p in patterns if "**" not in p]
+    recursive = tuple(_compile_pattern(p) for p in patterns if "**" in p)
+
+    if not simple:
+        return lambda path_str: any(matches(path_str) for matches in recursive)
+
+    union = re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in simple))
+
+    def match_any(path_str: str) -> bool:
+        if union.match(os.path.normcase(path_str)):
+            return True
+        return any(matches(path_str) for matches in recursive)
+
+    return match_any
+
 
 @dataclass
 class DocumentInfo:
@@ -28,7 +85,12 @@ class DocumentLoader:
     """Loads and discovers Markdown/MDX files from a directory."""
 
     def __init__(
-        self, source_dir: Path, repo: str, ref: str, project_config: Any = None
+        self,
+        source_dir: Path,
+        repo: str,
+        ref: str,
+        project_config: Any = None,
+        max_workers: int | None = None,
     ):
         """Initialize the document loader.
 
@@ -37,11 +99,14 @@ class DocumentLoader:
             repo: Repository identifier (e.g., 'vercel/next.js')
             ref: Git reference (branch or commit SHA)
             project_config: Optional project configuration object
+            max_workers: Threads used to read files (default scales with
+                the CPU count; 1 reads files sequentially)
         """
         self.source_dir = Path(source_dir)
         self.repo = repo
         self.ref = ref
         self.project_config = project_config
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
 
         # Use project config or defaults
         if project_config:
@@ -69,6 +134,10 @@ class DocumentLoader:
             ],
         )
 
+        # Pattern matchers, classified and compiled once per loader
+        self._excluded = _compile_patterns(tuple(self.exclude_patterns))
+        self._included = _compile_patterns(tuple(self.include_patterns))
+
     def _adjust_patterns_for_folder(self) -> None:
         """Adjust include/exclude patterns when processing a specific configured folder."""
         if not self.project_config or not self.project_config.folders:
@@ -97,45 +166,26 @@ class DocumentLoader:
         relative_path = file_path.relative_to(self.source_dir)
         path_str = str(relative_path)
 
-        # Check exclude patterns first
-        for pattern in self.exclude_patterns:
-            if self._matches_pattern(path_str, pattern):
-                return False
-
-        # Check include patterns
-        for pattern in self.include_patterns:
-            if self._matches_pattern(path_str, pattern):
-                return True
-
-        return False
+        # Check exclude patterns first, then include patterns
+        return not self._excluded(path_str) and self._included(path_str)
 
     def _matches_pattern(self, path_str: str, pattern: str) -> bool:
         """Check if a path matches a glob pattern, supporting ** wildcards."""
-        # Use pathlib for patterns with **
-        if "**" in pattern:
-            try:
-                # Convert to Path and use match
-                path_obj = Path(path_str)
-                return path_obj.match(pattern)
-            except Exception:
-                # Fallback to fnmatch if Path.match fails
-                return fnmatch.fnmatch(path_str, pattern)
-        else:
-            # Use fnmatch for simple patterns
-            return fnmatch.fnmatch(path_str, pattern)
+        return _compile_pattern(pattern)(path_str)
 
     def _extract_title(self, content: str, file_path: str) -> str | None:
         """Extract title from content (frontmatter or first heading)."""
-        try:
-            # Try to parse frontmatter
-            post = frontmatter.loads(content)
-            if post.metadata.get("title"):
-                return post.metadata["title"]
-        except Exception:
-            pass
+        # Try to parse frontmatter, skipping the parse when there is none
+        if _FRONTMATTER_START_RE.match(content):
+            try:
+                post = frontmatter.loads(content)
+                if post.metadata.get("title"):
+                    return post.metadata["title"]
+            except Exception:
+                pass
 
         # Look for first heading
-        lines = content.split("\n")
+        lines = content.split("\n", 20)
         for line in lines[:20]:  # Check first 20 lines
             line = line.strip()
             if line.startswith("# "):
@@ -153,6 +203,48 @@ class DocumentLoader:
         # For other repos or full URLs, return a generic format
         return f"{self.repo}/{self.ref}/{relative_path}"
 
+    def _prunable_directories(self) -> frozenset[str]:
+        """Return relative directories whose files are all excluded.
+
+        A simple exclude pattern of the form "<dir>/*" matches every path
+        below <dir>, since fnmatch's "*" also matches "/", so the walk can
+        skip such directories without listing them.
+        """
+        prunable = set()
+        for pattern in self.exclude_patterns:
+            prefix, _, last = pattern.rpartition("/")
+            if last == "*" and prefix and not any(c in prefix for c in "*?["):
+                prunable.add(os.path.normcase(prefix))
+        return frozenset(prunable)
+
+    def _walk_files(self) -> Iterator[Path]:
+        """Yield Markdown/MDX files below source_dir, skipping excluded directories.
+
+        Like Path.rglob, symlinked files are yielded but symlinked
+        directories are not descended into.
+        """
+        prunable = self._prunable_directories()
+        stack = [(str(self.source_dir), "")]
+
+        while stack:
+            directory, relative = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                logger.warning("Failed to scan directory", path=directory, error=str(e))
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    child = (
+                        os.path.join(relative, entry.name) if relative else entry.name
+                    )
+                    if os.path.normcase(child) not in prunable:
+                        stack.append((entry.path, child))
+                elif entry.name.lower().endswith(_MD_SUFFIXES) and entry.is_file():
+                    yield Path(entry.path)
+
     def discover_files(self) -> Iterator[DocumentInfo]:
         """Discover and yield document information for all matching files."""
         if not self.source_dir.exists():
@@ -160,36 +252,71 @@ class DocumentLoader:
             return
 
         # Find all Markdown/MDX files
-        for file_path in self.source_dir.rglob("*"):
-            if not file_path.is_file():
-                continue
+        file_paths = [
+            file_path
+            for file_path in self._walk_files()
+            if self._should_include_file(file_path)
+        ]
+
+        # Reads are I/O-bound and independent, so overlap them on a thread
+        # pool; results are still yielded in discovery order
+        if self.max_workers > 1 and len(file_paths) > 1:
+            yield from self._load_in_threads(file_paths)
+        else:
+            for file_path in file_paths:
+                document = self._load_one(file_path)
+                if document is not None:
+                    yield document
 
-            if file_path.suffix.lower() not in [".md", ".mdx"]:
-                continue
+    def _load_in_threads(self, file_paths: list[Path]) -> Iterator[DocumentInfo]:
+        """Load files on a thread pool, yielding documents in order.
 
-            if not self._should_include_file(file_path):
-                continue
+        At most 2 * max_workers reads are in flight or waiting to be
+        consumed, so a slow consumer never holds the whole corpus in memory.
+        Closing the generator early cancels the reads not yet started.
+        """
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        remaining = iter(file_paths)
+        pending: deque[Future[DocumentInfo | None]] = deque(
+            executor.submit(self._load_one, file_path)
+            for file_path in islice(remaining, 2 * self.max_workers)
+        )
 
-            try:
-                # Read file content
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
+        try:
+            while pending:
+                document = pending.popleft().result()
+                # Keep the window full while the consumer handles this one
+                for file_path in remaining:
+                    pending.append(executor.submit(self._load_one, file_path))
+                    break
+                if document is not None:
+                    yield document
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def _load_one(self, file_path: Path) -> DocumentInfo | None:
+        """Read a file and build its DocumentInfo, or None if it fails."""
+        try:
+            # Read file content
+            with open(file_path, encoding="utf-8") as f:
+                content = f.read()
 
-                # Get relative path
-                relative_path = str(file_path.relative_to(self.source_dir))
+            # Get relative path
+            relative_path = str(file_path.relative_to(self.source_dir))
 
-                # Extract title
-                title = self._extract_title(content, relative_path)
+            # Extract title
+            title = self._extract_title(content, relative_path)
 
-                # Build canonical URL
-                canonical_url = self._build_canonical_url(relative_path)
+            # Build canonical URL
+            canonical_url = self._build_canonical_url(relative_path)
 
-                yield DocumentInfo(
-                    path=relative_path,
-                    content=content,
-                    title=title,
-                    canonical_url=canonical_url,
-                )
+            return DocumentInfo(
+                path=relative_path,
+                content=content,
+                title=title,
+                canonical_url=canonical_url,
+            )
 
-            except Exception as e:
-                logger.error("Failed to read file", path=file_path, error=str(e))
+        except Exception as e:
+            logger.error("Failed to read file", path=file_path, error=str(e))
+            return None
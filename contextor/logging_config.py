@@ -3,22 +3,52 @@
 import logging
 import os
 import sys
+import time
+from pathlib import Path
 from typing import Any
 
 import structlog
 from structlog.processors import TimeStamper
 
+# Processors shared by every configuration, built once at import
+_BASE_PROCESSORS = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    TimeStamper(fmt="iso", utc=True),
+)
+_CALLSITE_PROCESSOR = structlog.processors.CallsiteParameterAdder(
+    parameters=[
+        structlog.processors.CallsiteParameter.FILENAME,
+        structlog.processors.CallsiteParameter.FUNC_NAME,
+        structlog.processors.CallsiteParameter.LINENO,
+    ]
+)
+
+# Set once configure_logging has run, so later calls are no-ops
+_CONFIGURED = False
+
 
 def configure_logging(
-    level: str = "INFO", json_output: bool | None = None, include_context: bool = True
+    level: str = "INFO",
+    json_output: bool | None = None,
+    include_context: bool = True,
+    force: bool = False,
 ) -> None:
     """Configure structured logging for Contextor.
 
+    Only the first call takes effect, so that entry points sharing a process
+    do not reset structlog's logger cache; pass force=True to reconfigure.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         json_output: Force JSON output (defaults to True for production)
         include_context: Include contextual information in logs
+        force: Reconfigure even if logging was already configured
     """
+    global _CONFIGURED
+    if _CONFIGURED and not force:
+        return
+
     # Determine if we should use JSON output
     if json_output is None:
         # Use JSON in production/CI environments, human-readable in development
@@ -30,26 +60,17 @@ def configure_logging(
 
     # Configure standard library logging
     logging.basicConfig(
-        format="%(message)s", stream=sys.stdout, level=getattr(logging, level.upper())
+        format="%(message)s",
+        stream=sys.stdout,
+        level=getattr(logging, level.upper()),
+        force=force,
     )
 
     # Configure processors based on output format
-    processors = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        TimeStamper(fmt="iso", utc=True),
-    ]
+    processors = list(_BASE_PROCESSORS)
 
     if include_context:
-        processors.append(
-            structlog.processors.CallsiteParameterAdder(
-                parameters=[
-                    structlog.processors.CallsiteParameter.FILENAME,
-                    structlog.processors.CallsiteParameter.FUNC_NAME,
-                    structlog.processors.CallsiteParameter.LINENO,
-                ]
-            )
-        )
+        processors.append(_CALLSITE_PROCESSOR)
 
     if json_output:
         processors.append(structlog.processors.JSONRenderer())
@@ -68,6 +89,8 @@ def configure_logging(
         cache_logger_on_first_use=True,
     )
 
+    _CONFIGURED = True
+
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     """Get a configured logger instance.
@@ -94,8 +117,6 @@ def log_operation(
     Returns:
         Context dictionary for operation tracking
     """
-    import time
-
     op_context = {"operation": operation, "start_time": time.time(), **context}
 
     logger.info("Operation started", **op_context)
@@ -116,8 +137,6 @@ def log_operation_complete(
         success: Whether operation succeeded
         **additional_context: Additional context fields
     """
-    import time
-
     duration = time.time() - context["start_time"]
 
     final_context = {
@@ -147,15 +166,17 @@ def log_file_operation(
     Returns:
         Context dictionary for operation tracking
     """
-    from pathlib import Path
-
-    path = Path(file_path)
+    # A single stat call both checks existence and reads the size
+    try:
+        file_size = os.stat(file_path).st_size
+    except OSError:
+        file_size = None
 
     return log_operation(
         logger,
         operation,
         file_path=str(file_path),
-        file_name=path.name,
-        file_size_bytes=path.stat().st_size if path.exists() else None,
+        file_name=Path(file_path).name,
+        file_size_bytes=file_size,
         **context,
     )
@@ -2,10 +2,36 @@
 Contextor MCP Server - Model Context Protocol server for web content extraction and processing
 """
 
-from .handlers import SourceDocsHandlers
-from .server import ContextorMCPServer
-from .tools import CONTEXTOR_TOOLS
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .handlers import SourceDocsHandlers
+    from .server import ContextorMCPServer
+    from .tools import CONTEXTOR_TOOLS
 
 __all__ = ["ContextorMCPServer", "SourceDocsHandlers", "CONTEXTOR_TOOLS"]
 
 __version__ = "0.1.0"
+
+# Exports are imported on first access (PEP 562), so importing the package
+# or one of its submodules does not load the server and its web framework
+_LAZY_EXPORTS = {
+    "ContextorMCPServer": ".server",
+    "SourceDocsHandlers": ".handlers",
+    "CONTEXTOR_TOOLS": ".tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
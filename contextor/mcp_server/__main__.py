@@ -5,10 +5,11 @@ Entry point for running the Contextor MCP Server as a module
 import sys
 from pathlib import Path
 
-from contextor.mcp_server.server import main
+if not __package__:
+    # Launched as a script rather than with -m: make contextor importable
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-# Add the parent directory to the path so we can import contextor modules
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from contextor.mcp_server.server import main  # noqa: E402
 
 if __name__ == "__main__":
     main()
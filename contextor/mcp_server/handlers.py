@@ -2,27 +2,219 @@
 Request handlers for Contextor MCP Server - Updated for sourcedocs serving
 """
 
+import asyncio
+import heapq
 import logging
+import os
+import sys
+import threading
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, partial
+from operator import attrgetter
 from pathlib import Path
+from stat import S_ISREG
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on files read concurrently by one request
+_MAX_CONCURRENT_READS = 64
+
+# Files whose lines and words are counted
+_TEXT_SUFFIXES = frozenset({".md", ".txt", ".mdx"})
+
+# Default number of decoded files kept between requests
+_DEFAULT_TEXT_CACHE_SIZE = 1024
+
+# Default cap on the memory held by the cached files' text
+_DEFAULT_TEXT_CACHE_BYTES = 256 * 1024 * 1024
+
+# Tooling directories that never hold sourcedocs content; walks skip them
+_IGNORED_DIRECTORIES = frozenset({".git", "node_modules", ".venv"})
+
+
+def _iter_files(directory: Path) -> Iterator[os.DirEntry[str]]:
+    """Yield the files below a directory, as Path.rglob("*") and is_file() would.
+
+    Directories are walked depth first in os.scandir order, each directory's
+    files before its subdirectories, without following symlinked directories.
+    DirEntry keeps the file type from the directory read, so telling files
+    from directories needs no stat call. Directories named in
+    _IGNORED_DIRECTORIES are not descended into.
+    """
+    stack = [os.fspath(directory)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directories are skipped
+
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _IGNORED_DIRECTORIES:
+                    subdirectories.append(entry.path)
+            elif entry.is_file():
+                yield entry
+
+        stack.extend(reversed(subdirectories))
+
+
+def _suffix(name: str) -> str:
+    """Return the last suffix of a file name, as PurePath.suffix does."""
+    i = name.rfind(".")
+    return name[i:] if 0 < i < len(name) - 1 else ""
+
+
+class _CachedText:
+    """Decoded file content and the values derived from it, computed on first use"""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    @cached_property
+    def lower_content(self) -> str:
+        return self.content.lower()
+
+    # Counting through splitlines()/split() measured faster than allocation-free
+    # alternatives (summed str.count calls, regex iteration), and with the
+    # cache each count runs once per file version
+    @cached_property
+    def line_count(self) -> int:
+        return len(self.content.splitlines())
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.content.split())
+
+
+def _text_cache_charge(content: str) -> int:
+    """Memory charged to a cached file: its text plus the lowercase copy
+
+    The copy is charged up front because the first search fills it. Both are
+    measured in memory rather than on disk, since decoding non-ASCII text
+    can take up to four bytes per character.
+    """
+    return 2 * sys.getsizeof(content)
+
+
+@dataclass(slots=True)
+class _ListedFile:
+    """A file in a source listing, kept in raw form until the response is built"""
+
+    path: str
+    name: str
+    mtime: float
+    size: int | None = None
+    lines: int | None = None
+    words: int | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        file_info: dict[str, Any] = {
+            "path": self.path,
+            "name": self.name,
+            "modified": _format_timestamp(self.mtime),
+        }
+        if self.size is not None:
+            file_info["size"] = self.size
+        if self.lines is not None:
+            file_info["lines"] = self.lines
+            file_info["words"] = self.words
+        return file_info
+
+
+def _format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp as a local-time ISO 8601 string"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+async def _map_in_threads(
+    func: Callable[[os.DirEntry[str]], Any], entries: Iterable[os.DirEntry[str]]
+) -> list[Any]:
+    """Run a blocking function over directory entries in worker threads.
+
+    Keeps the event loop free while files are read, and overlaps the reads
+    with each other. Results are returned in input order.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+
+    async def run(entry: os.DirEntry[str]) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(func, entry)
+
+    return await asyncio.gather(*(run(entry) for entry in entries))
+
+
+async def _imap_in_threads(
+    func: Callable[[os.DirEntry[str]], Any], entries: Iterable[os.DirEntry[str]]
+) -> AsyncIterator[Any]:
+    """Like _map_in_threads, but yield results in input order as they are ready.
+
+    At most _MAX_CONCURRENT_READS calls are in flight, so finished results
+    are handed over as they arrive instead of being held for the whole run.
+    """
+    pending: deque[asyncio.Task[Any]] = deque()
+    try:
+        for entry in entries:
+            if len(pending) >= _MAX_CONCURRENT_READS:
+                yield await pending.popleft()
+            pending.append(asyncio.create_task(asyncio.to_thread(func, entry)))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        # The consumer stopped early: drop the calls not yet started
+        for task in pending:
+            task.cancel()
+
 
 class SourceDocsHandlers:
     """
     Handles MCP tool invocations for serving sourcedocs content
     """
 
-    def __init__(self, sourcedocs_path: Path):
+    def __init__(
+        self,
+        sourcedocs_path: Path,
+        text_cache_size: int = _DEFAULT_TEXT_CACHE_SIZE,
+        text_cache_bytes: int = _DEFAULT_TEXT_CACHE_BYTES,
+    ):
         """
         Initialize handlers with sourcedocs directory path
 
         Args:
             sourcedocs_path: Path to the sourcedocs directory
+            text_cache_size: Maximum number of decoded files cached between
+                requests (0 disables the cache)
+            text_cache_bytes: Maximum memory, in bytes, held by the cached
+                files' decoded and lowercased text; larger files are never cached
         """
         self.sourcedocs_path = sourcedocs_path.resolve()
+        # Prefix stripped from walked entry paths to make them relative
+        self._root_prefix = os.path.join(self.sourcedocs_path, "")
+
+        # LRU cache of decoded files, keyed by path and validated against the
+        # file's (mtime_ns, size), with each entry's memory charge; filled
+        # from worker threads, hence the lock
+        self._text_cache_size = text_cache_size
+        self._text_cache_max_bytes = text_cache_bytes
+        self._text_cache: OrderedDict[
+            str, tuple[tuple[int, int], _CachedText, int]
+        ] = OrderedDict()
+        self._text_cache_bytes = 0
+        self._text_cache_hits = 0
+        self._text_cache_misses = 0
+        self._text_cache_lock = threading.Lock()
+
+        # Index of slug -> first "<slug>.md" in walk order, built on the first
+        # slug lookup and rebuilt when the root directory's mtime changes;
+        # stored with that mtime as one tuple, so lookups from worker
+        # threads always see a matching pair
+        self._slug_index: tuple[int | None, dict[str, Path]] | None = None
 
         if not self.sourcedocs_path.exists():
             raise ValueError(f"Sourcedocs path does not exist: {self.sourcedocs_path}")
@@ -63,7 +255,7 @@ class SourceDocsHandlers:
             if source_slug:
                 # List specific source
                 source_path = self.sourcedocs_path / source_slug
-                if not source_path.exists():
+                if not await asyncio.to_thread(source_path.exists):
                     return {
                         "status": "not_found",
                         "error": f"Source not found: {source_slug}",
@@ -75,20 +267,21 @@ class SourceDocsHandlers:
 
             else:
                 # List all sources
-                sources = []
+                items = await asyncio.to_thread(self._list_source_names)
+                sources = [{"slug": name, "path": name} for name in items]
 
-                for item in self.sourcedocs_path.iterdir():
-                    if item.is_dir() and not item.name.startswith("."):
-                        source_info = {
-                            "slug": item.name,
-                            "path": str(item.relative_to(self.sourcedocs_path)),
-                        }
-
-                        if include_stats:
-                            stats = await self._get_source_stats(item, since_timestamp)
-                            source_info.update(stats)
-
-                        sources.append(source_info)
+                if include_stats:
+                    # Each source is walked in its own worker thread
+                    all_stats = await asyncio.gather(
+                        *(
+                            self._get_source_stats(
+                                self.sourcedocs_path / name, since_timestamp
+                            )
+                            for name in items
+                        )
+                    )
+                    for source_info, stats in zip(sources, all_stats, strict=True):
+                        source_info.update(stats)
 
                 return {
                     "status": "success",
@@ -101,7 +294,10 @@ class SourceDocsHandlers:
             return {"status": "error", "error": str(e)}
 
     async def get_file(
-        self, path: str | None = None, slug: str | None = None
+        self,
+        path: str | None = None,
+        slug: str | None = None,
+        include_stats: bool = True,
     ) -> dict[str, Any]:
         """
         Retrieve a specific file by path or slug
@@ -109,6 +305,7 @@ class SourceDocsHandlers:
         Args:
             path: File path relative to sourcedocs/
             slug: Alternative file slug identifier
+            include_stats: Whether to include line and word counts
 
         Returns:
             File content and metadata
@@ -120,44 +317,51 @@ class SourceDocsHandlers:
             if path:
                 file_path = self.sourcedocs_path / path
             elif slug:
-                # Convert slug to path (basic implementation)
-                file_path = self._slug_to_path(slug)
+                # Convert slug to path (basic implementation); building the
+                # slug index walks the tree, so it runs off the event loop
+                file_path = await asyncio.to_thread(self._slug_to_path, slug)
             else:
                 return {
                     "status": "error",
                     "error": "Either path or slug must be provided",
                 }
 
-            if not file_path.exists():
+            # One stat answers existence, file type and metadata; it and the
+            # read run in worker threads to keep the event loop free
+            try:
+                stat = await asyncio.to_thread(os.stat, file_path)
+            except (FileNotFoundError, NotADirectoryError):
                 return {
                     "status": "not_found",
                     "error": f"File not found: {path or slug}",
                 }
 
-            if not file_path.is_file():
+            if not S_ISREG(stat.st_mode):
                 return {
                     "status": "error",
                     "error": f"Path is not a file: {path or slug}",
                 }
 
-            # Read file content
-            content = file_path.read_text(encoding="utf-8")
+            # Read the content, or reuse the cached copy
+            text = await asyncio.to_thread(self._read_text, str(file_path), stat)
 
-            # Get file stats
-            stat = file_path.stat()
+            metadata: dict[str, Any] = {
+                "size": stat.st_size,
+                "modified": _format_timestamp(stat.st_mtime),
+                "created": _format_timestamp(stat.st_ctime),
+                "encoding": "utf-8",
+            }
+
+            # Content statistics take a full pass over the file each
+            if include_stats:
+                metadata["line_count"] = text.line_count
+                metadata["word_count"] = text.word_count
 
             return {
                 "status": "success",
                 "path": str(file_path.relative_to(self.sourcedocs_path)),
-                "content": content,
-                "metadata": {
-                    "size": stat.st_size,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                    "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                    "encoding": "utf-8",
-                    "line_count": len(content.splitlines()),
-                    "word_count": len(content.split()),
-                },
+                "content": text.content,
+                "metadata": metadata,
             }
 
         except Exception as e:
@@ -186,64 +390,98 @@ class SourceDocsHandlers:
         logger.info(f"Searching for: '{query}' in source: {source_filter}")
 
         try:
-            results = []
-            search_path = (
-                self.sourcedocs_path / source_filter
-                if source_filter
-                else self.sourcedocs_path
-            )
-
-            if not search_path.exists():
-                return []
-
-            # Search through markdown files
-            for file_path in search_path.rglob("*.md"):
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-
-                    # Simple case-insensitive search
-                    if query.lower() in content.lower():
-                        # Calculate relevance score (simple count)
-                        score = content.lower().count(query.lower())
-
-                        result = {
-                            "path": str(file_path.relative_to(self.sourcedocs_path)),
-                            "score": score,
-                            "source": file_path.parts[len(self.sourcedocs_path.parts)],
-                        }
-
-                        if include_content:
-                            # Extract preview snippet
-                            preview = self._extract_preview(content, query)
-                            result["preview"] = preview
-
-                        # Get file metadata
-                        stat = file_path.stat()
-                        result["metadata"] = {
-                            "size": stat.st_size,
-                            "modified": datetime.fromtimestamp(
-                                stat.st_mtime
-                            ).isoformat(),
-                        }
-
-                        results.append(result)
-
-                except Exception as e:
-                    logger.warning(f"Error searching file {file_path}: {e}")
-                    continue
-
-            # Sort by relevance score and limit
+            # Keep only the top results by relevance score while matches
+            # stream in; ties keep walk order, like a stable sort and slice
             def get_score(x: dict[str, Any]) -> float:
                 score = x.get("score", 0)
                 return float(score) if score is not None else 0.0
 
-            results.sort(key=get_score, reverse=True)
-            return results[:limit]
+            heap: list[tuple[float, int, dict[str, Any]]] = []
+            position = 0
+            async for result in self._scan_matches(
+                query, source_filter, include_content
+            ):
+                item = (get_score(result), -position, result)
+                position += 1
+                if len(heap) < limit:
+                    heapq.heappush(heap, item)
+                elif limit > 0:
+                    heapq.heappushpop(heap, item)
+
+            top_results = [result for *_, result in sorted(heap, reverse=True)]
+
+            # Only the returned results pay for timestamp formatting
+            for result in top_results:
+                metadata = result["metadata"]
+                metadata["modified"] = _format_timestamp(metadata["modified"])
+
+            return top_results
 
         except Exception as e:
             logger.error(f"Error searching: {e}", exc_info=True)
             return []
 
+    async def iter_search(
+        self,
+        query: str,
+        source_filter: str | None = None,
+        include_content: bool = True,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream search matches as files are scanned, unranked and in walk order
+
+        Args:
+            query: Search query string
+            source_filter: Optional source slug to filter by
+            include_content: Whether to include content snippets
+
+        Yields:
+            Search results, shaped like those returned by search()
+        """
+        logger.info(f"Streaming search for: '{query}' in source: {source_filter}")
+
+        try:
+            async for result in self._scan_matches(
+                query, source_filter, include_content
+            ):
+                metadata = result["metadata"]
+                metadata["modified"] = _format_timestamp(metadata["modified"])
+                yield result
+
+        except Exception as e:
+            logger.error(f"Error searching: {e}", exc_info=True)
+
+    async def _scan_matches(
+        self, query: str, source_filter: str | None, include_content: bool
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield the matching files' results, with raw mtimes, in walk order"""
+        search_path = (
+            self.sourcedocs_path / source_filter
+            if source_filter
+            else self.sourcedocs_path
+        )
+
+        if not await asyncio.to_thread(search_path.exists):
+            return
+
+        # Search through markdown files
+        entries = await asyncio.to_thread(
+            lambda: [
+                entry
+                for entry in _iter_files(search_path)
+                if entry.name.endswith(".md")
+            ]
+        )
+        search_file = partial(
+            self._search_file,
+            query=query,
+            lower_query=query.lower(),
+            include_content=include_content,
+        )
+        async for result in _imap_in_threads(search_file, entries):
+            if result is not None:
+                yield result
+
     async def stats(self, detailed: bool = False) -> dict[str, Any]:
         """
         Get statistics about the sourcedocs repository
@@ -262,53 +500,54 @@ class SourceDocsHandlers:
             total_lines = 0
             total_words = 0
             sources: dict[str, dict[str, Any]] = {}
+            sources_seen: set[str] = set()
             file_types: dict[str, int] = {}
 
-            for file_path in self.sourcedocs_path.rglob("*"):
-                if file_path.is_file() and not file_path.name.startswith("."):
-                    # Count file
-                    total_files += 1
-
-                    # Get file stats
-                    stat = file_path.stat()
-                    total_size += stat.st_size
-
-                    # Count file type
-                    suffix = file_path.suffix.lower()
-                    file_types[suffix] = file_types.get(suffix, 0) + 1
-
-                    # Get source from path
-                    source_name = file_path.parts[len(self.sourcedocs_path.parts)]
-
-                    if detailed:
-                        if source_name not in sources:
-                            sources[source_name] = {"files": 0, "size": 0, "types": {}}
+            entries = await asyncio.to_thread(
+                self._list_visible_files, self.sourcedocs_path
+            )
 
-                        sources[source_name]["files"] += 1
-                        sources[source_name]["size"] += stat.st_size
-                        sources[source_name]["types"][suffix] = (
-                            sources[source_name]["types"].get(suffix, 0) + 1
-                        )
+            for file_stats in await _map_in_threads(self._file_stats, entries):
+                if file_stats is None:
+                    continue
 
-                    # Count lines and words for text files
-                    if suffix in [".md", ".txt", ".mdx"]:
-                        try:
-                            content = file_path.read_text(encoding="utf-8")
-                            lines = len(content.splitlines())
-                            words = len(content.split())
+                # Count file
+                total_files += 1
+                size = file_stats["size"]
+                total_size += size
+
+                # Count file type
+                suffix = file_stats["suffix"]
+                file_types[suffix] = file_types.get(suffix, 0) + 1
+
+                # Count lines and words for readable text files
+                has_lines = "lines" in file_stats
+                if has_lines:
+                    total_lines += file_stats["lines"]
+                    total_words += file_stats["words"]
+
+                # Get source from path; the summary only needs the names
+                source_name = file_stats["source"]
+                if not detailed:
+                    sources_seen.add(source_name)
+                    continue
 
-                            total_lines += lines
-                            total_words += words
+                source_stats = sources.get(source_name)
+                if source_stats is None:
+                    source_stats = {"files": 0, "size": 0, "types": {}}
+                    sources[source_name] = source_stats
 
-                            if detailed and source_name in sources:
-                                if "lines" not in sources[source_name]:
-                                    sources[source_name]["lines"] = 0
-                                    sources[source_name]["words"] = 0
-                                sources[source_name]["lines"] += lines
-                                sources[source_name]["words"] += words
+                source_stats["files"] += 1
+                source_stats["size"] += size
+                types = source_stats["types"]
+                types[suffix] = types.get(suffix, 0) + 1
 
-                        except Exception:
-                            pass  # Skip files that can't be read
+                if has_lines:
+                    if "lines" not in source_stats:
+                        source_stats["lines"] = 0
+                        source_stats["words"] = 0
+                    source_stats["lines"] += file_stats["lines"]
+                    source_stats["words"] += file_stats["words"]
 
             result = {
                 "status": "success",
@@ -324,13 +563,7 @@ class SourceDocsHandlers:
             if detailed:
                 result["sources"] = sources
             else:
-                result["source_count"] = len(
-                    {
-                        file_path.parts[len(self.sourcedocs_path.parts)]
-                        for file_path in self.sourcedocs_path.rglob("*")
-                        if file_path.is_file() and not file_path.name.startswith(".")
-                    }
-                )
+                result["source_count"] = len(sources_seen)
 
             return result
 
@@ -348,43 +581,24 @@ class SourceDocsHandlers:
         include_stats: bool,
     ) -> dict[str, Any]:
         """Get detailed listing for a specific source"""
-        files = []
-
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                stat = file_path.stat()
-
-                # Filter by timestamp if provided
-                if since_timestamp and stat.st_mtime < since_timestamp:
-                    continue
-
-                file_info: dict[str, Any] = {
-                    "path": str(file_path.relative_to(self.sourcedocs_path)),
-                    "name": file_path.name,
-                    "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                }
-
-                if include_stats:
-                    file_info["size"] = stat.st_size
-
-                    # Add content stats for text files
-                    if file_path.suffix.lower() in [".md", ".txt", ".mdx"]:
-                        try:
-                            content = file_path.read_text(encoding="utf-8")
-                            file_info["lines"] = len(content.splitlines())
-                            file_info["words"] = len(content.split())
-                        except Exception:
-                            pass
-
-                files.append(file_info)
+        entries = await asyncio.to_thread(self._list_visible_files, source_path)
+        described = await _map_in_threads(
+            partial(
+                self._describe_file,
+                since_timestamp=since_timestamp,
+                include_stats=include_stats,
+            ),
+            entries,
+        )
+        files = [file_info for file_info in described if file_info is not None]
 
         # Sort by modification time (newest first)
-        files.sort(key=lambda x: x["modified"], reverse=True)
+        files.sort(key=attrgetter("mtime"), reverse=True)
 
         return {
             "status": "success",
             "source": source_slug,
-            "files": files,
+            "files": [file_info.to_dict() for file_info in files],
             "total_files": len(files),
         }
 
@@ -392,31 +606,213 @@ class SourceDocsHandlers:
         self, source_path: Path, since_timestamp: float | None
     ) -> dict[str, Any]:
         """Get statistics for a single source"""
+        # The walk and its stat calls block, so run them in a worker thread
+        return await asyncio.to_thread(
+            self._collect_source_stats, source_path, since_timestamp
+        )
+
+    def _collect_source_stats(
+        self, source_path: Path, since_timestamp: float | None
+    ) -> dict[str, Any]:
+        """Walk one source and total its file count, size and latest mtime"""
         file_count = 0
         total_size = 0
         latest_modified: float | None = None
 
-        for file_path in source_path.rglob("*"):
-            if file_path.is_file() and not file_path.name.startswith("."):
-                stat = file_path.stat()
+        for entry in self._list_visible_files(source_path):
+            stat = entry.stat()
 
-                # Filter by timestamp if provided
-                if since_timestamp and stat.st_mtime < since_timestamp:
-                    continue
+            # Filter by timestamp if provided
+            if since_timestamp and stat.st_mtime < since_timestamp:
+                continue
 
-                file_count += 1
-                total_size += stat.st_size
+            file_count += 1
+            total_size += stat.st_size
 
-                if latest_modified is None or stat.st_mtime > latest_modified:
-                    latest_modified = stat.st_mtime
+            if latest_modified is None or stat.st_mtime > latest_modified:
+                latest_modified = stat.st_mtime
 
         stats: dict[str, Any] = {"file_count": file_count, "total_size": total_size}
 
         if latest_modified:
-            stats["last_modified"] = datetime.fromtimestamp(latest_modified).isoformat()
+            stats["last_modified"] = _format_timestamp(latest_modified)
 
         return stats
 
+    def _list_source_names(self) -> list[str]:
+        """List the visible top-level directories, i.e. the source slugs"""
+        with os.scandir(self.sourcedocs_path) as it:
+            return [
+                entry.name
+                for entry in it
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+
+    def _list_visible_files(self, directory: Path) -> list[os.DirEntry[str]]:
+        """List the files below a directory, skipping hidden file names"""
+        return [
+            entry for entry in _iter_files(directory) if not entry.name.startswith(".")
+        ]
+
+    def _relative_path(self, entry: os.DirEntry[str]) -> str:
+        """Path of a walked entry relative to the sourcedocs directory"""
+        return entry.path[len(self._root_prefix) :]
+
+    def _source_name(self, entry: os.DirEntry[str]) -> str:
+        """Source slug of a walked entry: the first component of its relative path"""
+        start = len(self._root_prefix)
+        end = entry.path.find(os.sep, start)
+        return entry.path[start:end] if end != -1 else entry.path[start:]
+
+    def _read_text(self, path: str, stat: os.stat_result) -> _CachedText:
+        """Read a UTF-8 file, reusing the cached copy while it is unchanged"""
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._text_cache_lock:
+            cached = self._text_cache.get(path)
+            if cached is not None and cached[0] == key:
+                self._text_cache.move_to_end(path)
+                self._text_cache_hits += 1
+                return cached[1]
+            self._text_cache_misses += 1
+
+        with open(path, encoding="utf-8") as f:
+            text = _CachedText(f.read())
+
+        charge = _text_cache_charge(text.content)
+        if self._text_cache_size > 0 and charge <= self._text_cache_max_bytes:
+            with self._text_cache_lock:
+                replaced = self._text_cache.pop(path, None)
+                if replaced is not None:
+                    self._text_cache_bytes -= replaced[2]
+                self._text_cache[path] = (key, text, charge)
+                self._text_cache_bytes += charge
+
+                # Evict least recently used files until both limits hold
+                while (
+                    len(self._text_cache) > self._text_cache_size
+                    or self._text_cache_bytes > self._text_cache_max_bytes
+                ):
+                    _, (_, _, evicted_charge) = self._text_cache.popitem(last=False)
+                    self._text_cache_bytes -= evicted_charge
+
+        return text
+
+    def text_cache_info(self) -> dict[str, int]:
+        """Report the decoded-file cache's hit/miss counts and current size"""
+        with self._text_cache_lock:
+            return {
+                "hits": self._text_cache_hits,
+                "misses": self._text_cache_misses,
+                "files": len(self._text_cache),
+                "bytes": self._text_cache_bytes,
+            }
+
+    def _search_file(
+        self,
+        entry: os.DirEntry[str],
+        query: str,
+        lower_query: str,
+        include_content: bool,
+    ) -> dict[str, Any] | None:
+        """Search one file, returning its search result or None if no match"""
+        try:
+            stat = entry.stat()
+            text = self._read_text(entry.path, stat)
+
+            # Simple case-insensitive search; the relevance score
+            # (simple count) is zero when there is no match. This runs on
+            # decoded text rather than raw bytes: str.lower() also folds
+            # non-ASCII letters, some onto ASCII ones (KELVIN SIGN to "k"),
+            # which bytes.lower() leaves alone, and the lowered text is
+            # cached with the file so repeat searches only pay for count()
+            score = text.lower_content.count(lower_query)
+            if not score:
+                return None
+
+            relative_path = self._relative_path(entry)
+            result = {
+                "path": relative_path,
+                "score": score,
+                "source": self._source_name(entry),
+            }
+
+            if include_content:
+                # Extract preview snippet
+                preview = self._extract_preview(
+                    text.content, query, lower_content=text.lower_content
+                )
+                result["preview"] = preview
+
+            # Get file metadata; "modified" holds the raw mtime until the
+            # result makes the top of the ranking, see search()
+            result["metadata"] = {
+                "size": stat.st_size,
+                "modified": stat.st_mtime,
+            }
+
+            return result
+
+        except Exception as e:
+            logger.warning(f"Error searching file {entry.path}: {e}")
+            return None
+
+    def _file_stats(self, entry: os.DirEntry[str]) -> dict[str, Any] | None:
+        """Collect size, type and text statistics for one file, or None to skip"""
+        try:
+            stat = entry.stat()
+        except OSError:
+            return None
+
+        suffix = _suffix(entry.name).lower()
+        file_stats: dict[str, Any] = {
+            "source": self._source_name(entry),
+            "size": stat.st_size,
+            "suffix": suffix,
+        }
+
+        # Count lines and words for text files
+        if suffix in _TEXT_SUFFIXES:
+            try:
+                text = self._read_text(entry.path, stat)
+                file_stats["lines"] = text.line_count
+                file_stats["words"] = text.word_count
+            except Exception:
+                pass  # Skip files that can't be read
+
+        return file_stats
+
+    def _describe_file(
+        self,
+        entry: os.DirEntry[str],
+        since_timestamp: float | None,
+        include_stats: bool,
+    ) -> _ListedFile | None:
+        """Build the listing entry for one file, or None if it is filtered out"""
+        stat = entry.stat()
+
+        # Filter by timestamp if provided
+        if since_timestamp and stat.st_mtime < since_timestamp:
+            return None
+
+        file_info = _ListedFile(
+            path=self._relative_path(entry), name=entry.name, mtime=stat.st_mtime
+        )
+
+        if include_stats:
+            file_info.size = stat.st_size
+
+            # Add content stats for text files
+            if _suffix(entry.name).lower() in _TEXT_SUFFIXES:
+                try:
+                    text = self._read_text(entry.path, stat)
+                    file_info.lines = text.line_count
+                    file_info.words = text.word_count
+                except Exception:
+                    pass
+
+        return file_info
+
     def _slug_to_path(self, slug: str) -> Path:
         """Convert a slug to a file path (basic implementation)"""
         # This is a simple implementation - could be enhanced with a proper slug mapping
@@ -424,18 +820,53 @@ class SourceDocsHandlers:
             return self.sourcedocs_path / slug
         else:
             # Search for files matching the slug
-            for file_path in self.sourcedocs_path.rglob("*.md"):
-                if file_path.stem == slug:
-                    return file_path
+            file_path = self._lookup_slug(slug)
+            if file_path is not None:
+                return file_path
 
         # Fallback: treat as direct path
         return self.sourcedocs_path / f"{slug}.md"
 
+    def _lookup_slug(self, slug: str) -> Path | None:
+        """Find the first file named "<slug>.md" in walk order, if any.
+
+        Lookups are served from the slug index. Changes below the root do not
+        touch the root's mtime, so a miss or a hit on a file that no longer
+        exists also rebuilds the index before giving up.
+        """
+        try:
+            root_mtime_ns = self.sourcedocs_path.stat().st_mtime_ns
+        except OSError:
+            root_mtime_ns = None
+
+        slug_index = self._slug_index
+        if slug_index is not None and slug_index[0] == root_mtime_ns:
+            file_path = slug_index[1].get(slug)
+            if file_path is not None and os.path.lexists(file_path):
+                return file_path
+
+        index = self._build_slug_index()
+        self._slug_index = (root_mtime_ns, index)
+        return index.get(slug)
+
+    def _build_slug_index(self) -> dict[str, Path]:
+        """Map each slug to the first matching .md file in one walk of the tree"""
+        index: dict[str, Path] = {}
+        for entry in _iter_files(self.sourcedocs_path):
+            if entry.name.endswith(".md"):
+                index.setdefault(entry.name[:-3], Path(entry.path))
+        return index
+
     def _extract_preview(
-        self, content: str, query: str, context_chars: int = 150
+        self,
+        content: str,
+        query: str,
+        context_chars: int = 150,
+        lower_content: str | None = None,
     ) -> str:
         """Extract preview snippet around query match"""
-        lower_content = content.lower()
+        if lower_content is None:
+            lower_content = content.lower()
         lower_query = query.lower()
 
         pos = lower_content.find(lower_query)
@@ -447,16 +878,18 @@ class SourceDocsHandlers:
         start = max(0, pos - context_chars)
         end = min(len(content), pos + len(query) + context_chars)
 
-        preview = content[start:end]
-
-        # Clean up preview (remove incomplete lines at start/end)
-        lines = preview.split("\n")
-        if len(lines) > 1:
+        # Clean up preview (remove incomplete lines at start/end) by moving
+        # the bounds to the first and last newline, without splitting
+        first_newline = content.find("\n", start, end)
+        if first_newline != -1:
+            trimmed_start, trimmed_end = start, end
             if start > 0:
-                lines = lines[1:]  # Remove potentially incomplete first line
+                trimmed_start = first_newline + 1  # Drop incomplete first line
             if end < len(content):
-                lines = lines[:-1]  # Remove potentially incomplete last line
-            preview = "\n".join(lines)
+                trimmed_end = content.rfind("\n", start, end)  # And last line
+            preview = content[trimmed_start:trimmed_end]
+        else:
+            preview = content[start:end]
 
         # Add ellipsis if truncated
         if start > 0:
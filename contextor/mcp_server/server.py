@@ -3,19 +3,45 @@ Main MCP-compatible Server implementation for Contextor using FastAPI
 """
 
 import asyncio
-import json
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import FastAPI, HTTPException, Request
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sse_starlette.sse import EventSourceResponse
 
+from ..utils import HAVE_ORJSON, dumps_json
 from .handlers import SourceDocsHandlers
+from .tools import CONTEXTOR_TOOLS
+
+try:
+    from watchfiles import awatch
+
+    _HAVE_WATCHFILES = True
+except ImportError:  # Optional: /stream polls for updates instead
+    _HAVE_WATCHFILES = False
 
 logger = logging.getLogger(__name__)
 
+# Worker threads available to anyio. awatch waits for file events in
+# anyio.to_thread.run_sync, so every /stream client holds one of these tokens
+# for as long as it is connected; the default of 40 would stall the 41st.
+# The handlers' asyncio.to_thread calls use the loop's own executor instead.
+_WORKER_THREAD_LIMIT = 200
+
+
+def _build_sse_frame(event: bytes, data: bytes) -> bytes:
+    """Build a Server-Sent Events wire frame from an event name and JSON data.
+
+    JSON never contains raw newlines, so the data always fits on one line.
+    """
+    return b"event: " + event + b"\ndata: " + data + b"\n\n"
+
 
 class ContextorMCPServer:
     """
@@ -42,6 +68,8 @@ class ContextorMCPServer:
             title="Contextor MCP Server",
             description="Model Context Protocol compatible server for serving sourcedocs content",
             version="0.1.0",
+            lifespan=self._lifespan,
+            default_response_class=ORJSONResponse if HAVE_ORJSON else JSONResponse,
         )
 
         # Setup routes
@@ -51,20 +79,29 @@ class ContextorMCPServer:
             f"Contextor MCP Server initialized with sourcedocs: {self.sourcedocs_path}"
         )
 
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Make room in anyio's thread limiter for file-watching streams"""
+        if _HAVE_WATCHFILES:
+            limiter = anyio.to_thread.current_default_thread_limiter()
+            limiter.total_tokens = max(limiter.total_tokens, _WORKER_THREAD_LIMIT)
+        yield
+
     def _setup_routes(self) -> None:
         """Setup FastAPI routes for MCP tools"""
 
+        # The tool catalogue is static, so serialize it once rather than per request
+        tools_payload = dumps_json({"tools": CONTEXTOR_TOOLS})
+
         @self.app.get("/health")
         async def health() -> dict[str, str]:
             """Health check endpoint"""
             return {"status": "healthy", "timestamp": datetime.now().isoformat()}
 
         @self.app.get("/tools")
-        async def list_tools() -> dict[str, Any]:
+        async def list_tools() -> Response:
             """List available MCP tools"""
-            from .tools import CONTEXTOR_TOOLS
-
-            return {"tools": CONTEXTOR_TOOLS}
+            return Response(content=tools_payload, media_type="application/json")
 
         @self.app.post("/tools/list_source")
         async def list_source_tool(request: dict[str, Any]) -> dict[str, Any]:
@@ -137,7 +174,9 @@ class ContextorMCPServer:
 
         @self.app.get("/files")
         async def get_file_by_path(
-            path: str | None = None, slug: str | None = None
+            path: str | None = None,
+            slug: str | None = None,
+            include_stats: bool = True,
         ) -> dict[str, Any]:
             """REST endpoint to get file by path or slug"""
             if not path and not slug:
@@ -145,7 +184,9 @@ class ContextorMCPServer:
                     status_code=400, detail="Either path or slug must be provided"
                 )
 
-            result = await self.handlers.get_file(path=path, slug=slug)
+            result = await self.handlers.get_file(
+                path=path, slug=slug, include_stats=include_stats
+            )
             if result.get("status") == "not_found":
                 raise HTTPException(status_code=404, detail=result.get("error"))
             return result
@@ -179,39 +220,64 @@ class ContextorMCPServer:
 
             async def event_generator() -> Any:
                 last_check = datetime.now()
-
-                while True:
-                    if await request.is_disconnected():
-                        break
-
-                    try:
-                        # Check for any updates since last check
-                        current_time = datetime.now()
-                        since_iso = last_check.isoformat()
-
-                        # Get updated sources
-                        updates = await self.handlers.list_source(
-                            since=since_iso, include_stats=True
-                        )
-
-                        if updates.get("sources"):
-                            # Send update event
-                            event_data = {
-                                "type": "sources_updated",
-                                "timestamp": current_time.isoformat(),
-                                "data": updates,
-                            }
-
-                            yield {"event": "update", "data": json.dumps(event_data)}
-
-                        last_check = current_time
-                        await asyncio.sleep(30)  # Check every 30 seconds
-
-                    except Exception as e:
-                        logger.error(f"Error in SSE stream: {e}")
-                        yield {"event": "error", "data": json.dumps({"error": str(e)})}
-                        await asyncio.sleep(5)
-
+                # With watchfiles installed, wait on filesystem notifications
+                # so idle repositories are not rescanned every interval
+                changes: AsyncGenerator[Any, None] | None = None
+                if _HAVE_WATCHFILES:
+                    changes = awatch(self.sourcedocs_path)
+
+                try:
+                    while True:
+                        if await request.is_disconnected():
+                            break
+
+                        try:
+                            # Check for any updates since last check
+                            current_time = datetime.now()
+                            since_iso = last_check.isoformat()
+
+                            # Get updated sources
+                            updates = await self.handlers.list_source(
+                                since=since_iso, include_stats=True
+                            )
+
+                            if updates.get("sources"):
+                                # Send update event
+                                event_data = {
+                                    "type": "sources_updated",
+                                    "timestamp": current_time.isoformat(),
+                                    "data": updates,
+                                }
+
+                                yield _build_sse_frame(
+                                    b"update", dumps_json(event_data)
+                                )
+
+                            last_check = current_time
+                            if changes is not None:
+                                try:
+                                    await anext(changes)
+                                except Exception as e:
+                                    # The watcher ended (e.g. watch limit hit,
+                                    # directory removed); poll from now on
+                                    logger.warning(f"File watching stopped: {e!r}")
+                                    await changes.aclose()
+                                    changes = None
+                            if changes is None:
+                                await asyncio.sleep(30)  # Check every 30 seconds
+
+                        except Exception as e:
+                            logger.error(f"Error in SSE stream: {e}")
+                            yield _build_sse_frame(
+                                b"error", dumps_json({"error": str(e)})
+                            )
+                            await asyncio.sleep(5)
+                finally:
+                    if changes is not None:
+                        await changes.aclose()
+
+            # Frames are yielded pre-encoded; EventSourceResponse passes bytes
+            # through untouched and still handles pings and disconnects
             return EventSourceResponse(event_generator())
 
     def get_app(self) -> FastAPI:
@@ -39,6 +39,11 @@ CONTEXTOR_TOOLS = [
                     "type": "string",
                     "description": "Alternative: file slug identifier",
                 },
+                "include_stats": {
+                    "type": "boolean",
+                    "description": "Whether to include line and word counts in the metadata",
+                    "default": True,
+                },
             },
             "oneOf": [{"required": ["path"]}, {"required": ["slug"]}],
         },
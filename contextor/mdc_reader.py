@@ -0,0 +1,136 @@
+"""Lightweight .mdc reader that splits front-matter without re-parsing content."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+# Front-matter delimiter line, matching python-frontmatter's YAML boundary
+_BOUNDARY_RE = re.compile(rb"^-{3,}[ \t\r]*$", re.MULTILINE)
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+# LibYAML's C loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed headers keyed by (path, inode, mtime_ns, size); the inode catches
+# same-size os.replace() rewrites within one mtime tick
+HEADER_CACHE_SIZE = 4096
+_header_cache: OrderedDict[tuple[str, int, int, int], dict[str, Any]] = OrderedDict()
+# Files are read from loader and request-handler threads
+_header_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class MDCFile:
+    """Raw view of an .mdc file split into front-matter and body."""
+
+    path: Path
+    inode: int
+    mtime_ns: int
+    size: int
+    header: memoryview  # Raw YAML between the front-matter delimiters
+    body: memoryview  # Content after the front-matter, whitespace-stripped
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        """Front-matter metadata, parsed on first access and memoized."""
+        return parse_yaml_header(self)
+
+    @property
+    def content(self) -> str:
+        """Decoded document body."""
+        return str(self.body, "utf-8")
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the body, equal to utils.content_hash(self.content).
+
+        Hashes the raw bytes in place, skipping the decode/encode round-trip.
+        """
+        return hashlib.sha256(self.body).hexdigest()
+
+
+def _strip_bounds(data: bytes, start: int, end: int) -> tuple[int, int]:
+    """Return (start, end) of data[start:end] without surrounding whitespace."""
+    while start < end and data[start] in _WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in _WHITESPACE:
+        end -= 1
+    return start, end
+
+
+def read_mdc(path: Path) -> MDCFile:
+    """Read an .mdc file once and split it at the front-matter delimiters.
+
+    The header and body are memoryviews into a single buffer, so no
+    per-section copies are made and YAML is only parsed on demand.
+
+    Args:
+        path: Path to the .mdc file
+
+    Returns:
+        MDCFile view of the file
+    """
+    with open(path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        data = f.read()
+
+    view = memoryview(data)
+    start, end = _strip_bounds(data, 0, len(data))
+    header = view[0:0]
+
+    opening = _BOUNDARY_RE.match(data, start)
+    closing = _BOUNDARY_RE.search(data, opening.end()) if opening else None
+    if opening and closing:
+        header = view[opening.end() : closing.start()]
+        start, end = _strip_bounds(data, closing.end(), end)
+
+    return MDCFile(
+        path=Path(path),
+        inode=stat.st_ino,
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        header=header,
+        body=view[start:end],
+    )
+
+
+def parse_yaml_header(mdc: MDCFile) -> dict[str, Any]:
+    """Parse the YAML front-matter of an MDCFile, memoized per file version.
+
+    Each call returns its own deep copy of the memoized metadata, so callers
+    may modify it, nested mappings included, without affecting other readers.
+
+    Args:
+        mdc: File view returned by read_mdc
+
+    Returns:
+        Front-matter metadata (empty if the file has none)
+    """
+    key = (str(mdc.path), mdc.inode, mdc.mtime_ns, mdc.size)
+    with _header_cache_lock:
+        metadata = _header_cache.get(key)
+        if metadata is not None:
+            _header_cache.move_to_end(key)
+    if metadata is not None:
+        return copy.deepcopy(metadata)
+
+    loaded = (
+        yaml.load(str(mdc.header, "utf-8"), Loader=_YAML_LOADER) if mdc.header else None
+    )
+    metadata = loaded if isinstance(loaded, dict) else {}
+
+    with _header_cache_lock:
+        _header_cache[key] = metadata
+        if len(_header_cache) > HEADER_CACHE_SIZE:
+            _header_cache.popitem(last=False)
+    return copy.deepcopy(metadata)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -210,7 +211,8 @@ class ProjectConfigManager:
         self.config_dir = (
             config_dir or Path(__file__).parent.parent / "config" / "projects"
         )
-        self._configs_cache: dict[str, ProjectConfig] = {}
+        # Loaded configurations with the mtime of the file they came from
+        self._configs_cache: dict[str, tuple[int, ProjectConfig]] = {}
 
     def load_project_config(self, project_name: str) -> ProjectConfig | None:
         """Load a project configuration by name.
@@ -221,12 +223,13 @@ class ProjectConfigManager:
         Returns:
             ProjectConfig instance or None if not found
         """
-        if project_name in self._configs_cache:
-            return self._configs_cache[project_name]
-
         config_path = self.config_dir / f"{project_name}.json"
 
-        if not config_path.exists():
+        # One stat checks existence and whether the cached copy is current
+        try:
+            mtime_ns = config_path.stat().st_mtime_ns
+        except OSError:
+            self._configs_cache.pop(project_name, None)
             logger.warning(
                 "Project configuration not found",
                 project=project_name,
@@ -234,12 +237,16 @@ class ProjectConfigManager:
             )
             return None
 
+        cached = self._configs_cache.get(project_name)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
         try:
             with open(config_path, encoding="utf-8") as f:
                 config_data = json.load(f)
 
             config = ProjectConfig(config_data)
-            self._configs_cache[project_name] = config
+            self._configs_cache[project_name] = (mtime_ns, config)
 
             logger.info(
                 "Loaded project configuration", project=project_name, title=config.title
@@ -264,9 +271,12 @@ class ProjectConfigManager:
         if not self.config_dir.exists():
             return []
 
-        projects = []
-        for config_file in self.config_dir.glob("*.json"):
-            projects.append(config_file.stem)
+        with os.scandir(self.config_dir) as it:
+            projects = [
+                os.path.splitext(entry.name)[0]
+                for entry in it
+                if entry.name.endswith(".json")
+            ]
 
         return sorted(projects)
 
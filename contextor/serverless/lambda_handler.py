@@ -2,6 +2,7 @@
 AWS Lambda handler for Contextor MCP Server
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -11,6 +12,8 @@ from typing import Any
 
 # Import MCP server components
 from ..mcp_server import SourceDocsHandlers
+from ..mcp_server.tools import CONTEXTOR_TOOLS
+from ..utils import dumps_json
 
 # Configure logging
 logger = logging.getLogger()
@@ -23,6 +26,14 @@ BASE_PATH.mkdir(exist_ok=True)
 # Initialize handlers
 handlers = SourceDocsHandlers(BASE_PATH)
 
+# Tool names mapped to handler methods, built once per container
+TOOL_MAP: dict[str, Any] = {
+    "list_source": handlers.list_source,
+    "get_file": handlers.get_file,
+    "search": handlers.search,
+    "stats": handlers.stats,
+}
+
 
 async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
@@ -61,8 +72,6 @@ async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         # Route based on path
         if path == "/mcp/tools" and http_method == "GET":
             # List available tools
-            from ..mcp_server.tools import CONTEXTOR_TOOLS
-
             return {
                 "statusCode": 200,
                 "headers": {
@@ -83,7 +92,7 @@ async def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     "Content-Type": "application/json",
                     "Access-Control-Allow-Origin": "*",
                 },
-                "body": json.dumps(result),
+                "body": dumps_json(result).decode(),
             }
 
         elif path == "/mcp/resources" and http_method == "GET":
@@ -150,19 +159,11 @@ async def execute_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, A
     """
     logger.info(f"Executing tool: {tool_name} with args: {arguments}")
 
-    # Map tool names to handler methods
-    tool_map: dict[str, Any] = {
-        "list_source": handlers.list_source,
-        "get_file": handlers.get_file,
-        "search": handlers.search,
-        "stats": handlers.stats,
-    }
-
-    if tool_name not in tool_map:
+    handler = TOOL_MAP.get(tool_name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {tool_name}")
 
     # Execute tool
-    handler = tool_map[tool_name]
     result = await handler(**arguments)
 
     return result
@@ -209,8 +210,6 @@ def async_lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Async wrapper for Lambda handler to support async operations
     """
-    import asyncio
-
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
@@ -232,7 +231,7 @@ def async_lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                     "Content-Type": "application/json",
                     "Access-Control-Allow-Origin": "*",
                 },
-                "body": json.dumps(result),
+                "body": dumps_json(result).decode(),
             }
         else:
             # Use sync handler for non-async operations
@@ -249,8 +248,6 @@ if os.environ.get("ASYNC_HANDLER", "false").lower() == "true":
 else:
     # Need to create a sync wrapper for the async lambda_handler
     def sync_lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
-        import asyncio
-
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
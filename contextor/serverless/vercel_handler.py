@@ -2,6 +2,7 @@
 Vercel Functions handler for Contextor MCP Server
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -12,6 +13,7 @@ from typing import Any
 # Import MCP server components
 from ..mcp_server import SourceDocsHandlers
 from ..mcp_server.tools import CONTEXTOR_TOOLS
+from ..utils import dumps_json
 
 # Configure logging
 logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO"))
@@ -24,6 +26,14 @@ BASE_PATH.mkdir(exist_ok=True)
 # Initialize handlers
 handlers = SourceDocsHandlers(BASE_PATH)
 
+# Tool names mapped to handler methods, built once per container
+TOOL_MAP: dict[str, Any] = {
+    "list_source": handlers.list_source,
+    "get_file": handlers.get_file,
+    "search": handlers.search,
+    "stats": handlers.stats,
+}
+
 
 class handler(BaseHTTPRequestHandler):
     """
@@ -108,7 +118,7 @@ class handler(BaseHTTPRequestHandler):
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
 
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(dumps_json(result))
 
             elif self.path == "/api/mcp/batch":
                 # Execute multiple tools in batch
@@ -132,7 +142,7 @@ class handler(BaseHTTPRequestHandler):
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
 
-                self.wfile.write(json.dumps({"results": results}).encode())
+                self.wfile.write(dumps_json({"results": results}))
 
             else:
                 self.send_error(404, "Not found")
@@ -156,22 +166,10 @@ class handler(BaseHTTPRequestHandler):
         Returns:
             Tool execution result
         """
-        import asyncio
-
-        # Map tool names to handler methods
-        tool_map: dict[str, Any] = {
-            "list_source": handlers.list_source,
-            "get_file": handlers.get_file,
-            "search": handlers.search,
-            "stats": handlers.stats,
-        }
-
-        if tool_name not in tool_map:
+        handler = TOOL_MAP.get(tool_name)
+        if handler is None:
             raise ValueError(f"Unknown tool: {tool_name}")
 
-        # Run async handler in sync context
-        handler = tool_map[tool_name]
-
         # Create event loop if needed
         try:
             loop = asyncio.get_event_loop()
@@ -179,7 +177,7 @@ class handler(BaseHTTPRequestHandler):
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-        # Execute async function
+        # Run async handler in sync context
         result = loop.run_until_complete(handler(**arguments))
 
         return result
@@ -262,19 +260,12 @@ async def edge_handler(request: Any) -> Any:
                 tool_name = path.split("/")[-1]
 
                 # Execute tool
-                tool_map: dict[str, Any] = {
-                    "list_source": handlers.list_source,
-                    "get_file": handlers.get_file,
-                    "search": handlers.search,
-                    "stats": handlers.stats,
-                }
-
-                if tool_name not in tool_map:
+                handler = TOOL_MAP.get(tool_name)
+                if handler is None:
                     return JSONResponse(
                         {"error": f"Unknown tool: {tool_name}"}, status_code=400
                     )
 
-                handler = tool_map[tool_name]
                 result = await handler(**body)
 
                 return JSONResponse(result)
@@ -1,9 +1,19 @@
 """Link processing and hygiene transforms."""
 
 import re
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
+# Markdown inline link: [text](url)
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+
+
+@lru_cache(maxsize=4096)
+def _has_scheme(url: str) -> bool:
+    """Check whether a link URL is absolute, memoized since links repeat."""
+    return bool(urlparse(url).scheme)
+
 
 def fix_links(content: str, source_path: str = "") -> str:
     """Fix and clean up links in content.
@@ -71,7 +81,7 @@ def _fix_relative_links(content: str, source_path: str) -> str:
         link_url = match.group(2)
 
         # Skip absolute URLs
-        if urlparse(link_url).scheme:
+        if _has_scheme(link_url):
             return match.group(0)
 
         # Skip anchor links
@@ -86,6 +96,6 @@ def _fix_relative_links(content: str, source_path: str) -> str:
         return match.group(0)
 
     # Process markdown links
-    content = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", fix_link, content)
+    content = _MARKDOWN_LINK_RE.sub(fix_link, content)
 
     return content
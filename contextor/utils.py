@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import hashlib
+import json
+import os
 import re
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    HAVE_ORJSON = True
+except ImportError:  # Optional: JSON is handled by the json module instead
+    HAVE_ORJSON = False
+
 
 def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
     """Count tokens in text using tiktoken.
@@ -21,15 +30,22 @@ def count_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
     Note:
         Falls back to word-based estimation if tiktoken is not available.
     """
+    tokens = _count_tiktoken_tokens(text, encoding_name)
+    if tokens is None:
+        # Fallback to word-based estimation
+        return estimate_tokens_from_words(text)
+    return tokens
+
+
+def _count_tiktoken_tokens(text: str, encoding_name: str) -> int | None:
+    """Count tokens with tiktoken, or return None if it is not installed."""
     try:
         import tiktoken
-
-        encoding = tiktoken.get_encoding(encoding_name)
-        tokens = encoding.encode(text)
-        return len(tokens)
     except ImportError:
-        # Fallback to word-based estimation
-        return estimate_tokens_from_words(text)
+        return None
+
+    encoding = tiktoken.get_encoding(encoding_name)
+    return len(encoding.encode(text))
 
 
 def estimate_tokens_from_words(text: str) -> int:
@@ -41,7 +57,11 @@ def estimate_tokens_from_words(text: str) -> int:
     Returns:
         Estimated number of tokens (words * 4/3)
     """
-    words = len(text.split())
+    return _tokens_from_word_count(len(text.split()))
+
+
+def _tokens_from_word_count(words: int) -> int:
+    """Estimate token count from an already computed word count."""
     return int(words * 4 / 3)  # 1 token ≈ 3/4 words
 
 
@@ -66,10 +86,17 @@ def get_content_stats(text: str) -> dict[str, Any]:
     Returns:
         Dictionary with content statistics
     """
-    lines = text.splitlines()
-    words = text.split()
+    # Counting through splitlines()/split() is faster than regex scans, and
+    # the word count is computed once for all the statistics that use it,
+    # including the token count when tiktoken is not installed
+    line_count = len(text.splitlines())
+    word_count = len(text.split())
     chars = len(text)
-    chars_no_spaces = len(text.replace(" ", ""))
+    chars_no_spaces = chars - text.count(" ")
+    tokens_estimated_words = _tokens_from_word_count(word_count)
+    tokens = _count_tiktoken_tokens(text, "cl100k_base")
+    if tokens is None:
+        tokens = tokens_estimated_words
 
     # Count different types of content
     code_blocks = len(re.findall(r"```[\s\S]*?```", text))
@@ -78,19 +105,19 @@ def get_content_stats(text: str) -> dict[str, Any]:
     headings = len(re.findall(r"^#+\s", text, re.MULTILINE))
 
     return {
-        "lines": len(lines),
-        "words": len(words),
+        "lines": line_count,
+        "words": word_count,
         "characters": chars,
         "characters_no_spaces": chars_no_spaces,
-        "tokens": count_tokens(text),
-        "tokens_estimated_words": estimate_tokens_from_words(text),
+        "tokens": tokens,
+        "tokens_estimated_words": tokens_estimated_words,
         "tokens_estimated_chars": estimate_tokens_from_chars(text),
         "code_blocks": code_blocks,
         "inline_code": inline_code,
         "links": links,
         "headings": headings,
-        "avg_words_per_line": len(words) / max(1, len(lines)),
-        "avg_chars_per_word": chars / max(1, len(words)),
+        "avg_words_per_line": word_count / max(1, line_count),
+        "avg_chars_per_word": chars / max(1, word_count),
     }
 
 
@@ -123,16 +150,53 @@ def format_number(num: int) -> str:
     return f"{num:,}"
 
 
-def content_hash(content: str) -> str:
+def content_hash(content: str | bytes) -> str:
     """Generate SHA-256 hash of content.
 
     Args:
-        content: Content to hash
+        content: Content to hash, as text or its UTF-8 encoding (callers
+            that already hold the bytes skip a second encode)
 
     Returns:
         Hex digest of SHA-256 hash
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def dumps_json(obj: Any, newline: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: JSON-compatible value; NumPy scalars are accepted as well
+        newline: Whether to terminate the output with a newline (JSON Lines)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if HAVE_ORJSON:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+
+    data = json.dumps(obj).encode()
+    return data + b"\n" if newline else data
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Parsed value
+    """
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def slugify(text: str) -> str:
@@ -187,3 +251,41 @@ def ensure_directory(path: Path) -> None:
         path: Directory path to ensure exists
     """
     path.mkdir(parents=True, exist_ok=True)
+
+
+def find_files(directory: Path, suffix: str | tuple[str, ...]) -> list[Path]:
+    """Find entries below a directory whose names end with a suffix.
+
+    Returns what list(directory.rglob(f"*{suffix}")) would, in the same
+    order, without pathlib's per-entry pattern matching and path objects
+    for non-matching entries. Like rglob, symlinked directories are not
+    descended into.
+
+    Args:
+        directory: Directory to search
+        suffix: Case-sensitive name suffix, e.g. ".mdc", or a tuple of
+            suffixes to find in a single walk
+
+    Returns:
+        Matching paths, directory by directory in depth-first order
+    """
+    matches = []
+    stack = [os.fspath(directory)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            if entry.name.endswith(suffix):
+                matches.append(Path(entry.path))
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+
+        stack.extend(reversed(subdirectories))
+
+    return matches
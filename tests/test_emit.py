@@ -286,6 +286,23 @@ class TestMDCEmitter:
         assert entry["topics"] == ["updated"]
         assert entry["slug"] == "repo__updating"
 
+    def test_index_jsonl_kept_across_emitters(self):
+        """Test that a new emitter extends and updates an existing index."""
+        metadata = {"repo": "test/repo", "ref": "main", "title": "Doc"}
+
+        first = MDCEmitter(self.output_dir)
+        first.emit_mdc("# One", {**metadata, "path": "one.md"})
+        first.emit_mdc("# Two", {**metadata, "path": "two.md"})
+
+        second = MDCEmitter(self.output_dir)
+        second.emit_mdc("# Three", {**metadata, "path": "three.md"})
+        second.emit_mdc("# One, updated", {**metadata, "path": "one.md"})
+
+        with open(second.index_path, encoding="utf-8") as f:
+            slugs = [json.loads(line)["slug"] for line in f if line.strip()]
+
+        assert slugs == ["repo__two", "repo__three", "repo__one"]
+
     def test_should_skip_write_missing_file(self):
         """Test skip logic when file doesn't exist."""
         emitter = MDCEmitter(self.output_dir)
@@ -15,6 +15,9 @@ from contextor.intelligence import (
     SimilarityAnalyzer,
     TopicExtractor,
 )
+from contextor.intelligence.quality_scoring import _count_structure
+from contextor.intelligence.similarity import minhash_similarity
+from contextor.intelligence.topic_extraction import _count_occurrences
 
 
 @pytest.fixture
@@ -240,6 +243,39 @@ Class components extend React.Component and have a render method.
         assert "installation" in topics
         assert "configuration" in topics
 
+    def test_tiny_content_uses_metadata_topics(self):
+        """Test that tiny documents skip extraction and keep declared topics."""
+        extractor = TopicExtractor()
+        metadata = {
+            "title": "Stub Page",
+            "topics": ["stub", "index"],
+            "source": {"path": "docs/stub.md"},
+        }
+
+        assert extractor.extract_topics("# Stub", metadata) == ["stub", "index"]
+        assert extractor.extract_topics("", {}) == []
+
+        # A zero threshold runs the full pipeline even for tiny content
+        extractor = TopicExtractor({"min_content_length": 0})
+        assert "stub" in extractor.extract_topics("# Stub", metadata)
+
+    @pytest.mark.parametrize("have_ahocorasick", [True, False])
+    def test_count_occurrences_matches_str_count(self, have_ahocorasick):
+        """Test multi-topic counting against per-topic str.count."""
+        if have_ahocorasick:
+            pytest.importorskip("ahocorasick")
+        text = "react reactive components; component aaaa"
+        needles = {"react", "component", "aa", "missing"}
+
+        with patch(
+            "contextor.intelligence.topic_extraction._HAVE_AHOCORASICK",
+            have_ahocorasick,
+        ):
+            counts = _count_occurrences(text, needles)
+
+        assert counts == {needle: text.count(needle) for needle in needles}
+        assert counts["aa"] == 2  # Non-overlapping, like str.count
+
 
 class TestQualityScorer:
     """Test quality scoring functionality."""
@@ -319,6 +355,40 @@ More content here.
         )
         assert incompleteness < completeness
 
+    def test_score_batch_matches_score_quality(self):
+        """Test that batch scoring matches scoring documents one by one."""
+        scorer = QualityScorer()
+        documents = [
+            ("# Title\n\nSome content with a [link](https://example.com).", {}),
+            ("Short.", {"title": "Short", "fetched_at": "2020-01-01T00:00:00Z"}),
+        ]
+
+        expected = [scorer.score_quality(c, m) for c, m in documents]
+
+        assert scorer.score_batch(documents) == expected
+
+    def test_count_structure_single_pass(self):
+        """Test that each markdown construct is counted once."""
+        content = """Intro with `code`, a [link](https://example.com) and **bold**.
+
+```python
+- not a bullet
+```
+
+- item one
+- item two
+1. first
+"""
+        counts = _count_structure(content)
+
+        assert counts["code_block"] == 1
+        assert counts["inline_code"] == 1
+        assert counts["link"] == 1
+        assert counts["bullet"] == 2  # Lines inside the code block are skipped
+        assert counts["numbered"] == 1
+        assert counts["bold"] == 1
+        assert counts["italic"] == 0
+
     def test_score_freshness(self):
         """Test freshness scoring."""
         scorer = QualityScorer()
@@ -356,6 +426,31 @@ class TestSimilarityAnalyzer:
         assert fingerprint1 != fingerprint3  # Different content
         assert len(fingerprint1) == 16  # Expected length
 
+    def test_generate_minhash(self):
+        """Test MinHash signatures estimate shingle-set similarity."""
+        analyzer = SimilarityAnalyzer({"minhash_permutations": 32})
+
+        base = " ".join(f"word{i}" for i in range(200))
+        near = base + " extra trailing words"
+        other = " ".join(f"other{i}" for i in range(200))
+
+        signature = analyzer.generate_minhash(base)
+
+        assert len(signature) == 32 * 8
+        assert signature == analyzer.generate_minhash(base)
+        assert minhash_similarity(signature, analyzer.generate_minhash(near)) > 0.8
+        assert minhash_similarity(signature, analyzer.generate_minhash(other)) < 0.2
+        assert analyzer.generate_minhash("") == ""
+
+    def test_generate_minhash_matches_without_numpy(self):
+        """Test the NumPy and pure-Python MinHash paths agree exactly."""
+        analyzer = SimilarityAnalyzer()
+        content = " ".join(f"word{i % 700}" for i in range(10000))
+
+        signature = analyzer.generate_minhash(content)
+        with patch("contextor.intelligence.similarity._HAVE_NUMPY", False):
+            assert analyzer.generate_minhash(content) == signature
+
     def test_generate_content_vector(self):
         """Test content vector generation."""
         analyzer = SimilarityAnalyzer()
@@ -370,6 +465,39 @@ class TestSimilarityAnalyzer:
         assert vector["test"] >= 1
         assert vector["document"] >= 1
 
+    def test_max_similar_documents(self):
+        """Test that similar documents are limited to the top matches."""
+        content = "React hooks manage component state and side effects."
+        documents = [
+            {"slug": f"doc-{i}", "title": f"Doc {i}", "content": content}
+            for i in range(3)
+        ]
+
+        unlimited = SimilarityAnalyzer().find_similar_documents(documents)
+        limited = SimilarityAnalyzer(
+            {"max_similar_documents": 1}
+        ).find_similar_documents(documents)
+
+        assert len(unlimited["doc-0"]) == 2
+        assert limited["doc-0"] == unlimited["doc-0"][:1]
+
+    def test_sparse_similarity_matches_loop(self):
+        """Test the sparse matrix path finds the same pairs as the loop."""
+        analyzer = SimilarityAnalyzer()
+        words = "react hooks state effects props context render memo ref".split()
+        vectors = [
+            analyzer._generate_content_vector(" ".join(words[i % 3 : i % 3 + 7]))
+            for i in range(12)
+        ]
+
+        sparse_pairs = list(analyzer._similar_pairs_sparse(vectors))
+        loop_pairs = list(analyzer._similar_pairs(vectors))
+
+        assert loop_pairs
+        assert [pair[:2] for pair in sparse_pairs] == [pair[:2] for pair in loop_pairs]
+        for sparse_pair, loop_pair in zip(sparse_pairs, loop_pairs, strict=True):
+            assert sparse_pair[2] == pytest.approx(loop_pair[2])
+
     def test_calculate_similarity(self):
         """Test similarity calculation between vectors."""
         analyzer = SimilarityAnalyzer()
@@ -450,6 +578,101 @@ class TestCrossLinker:
         # Should not include doc3 (different topic)
         assert not any(r["slug"] == "python-basics" for r in related)
 
+    def test_precompute_matches_unindexed_results(self):
+        """Test that the precomputed topic index gives identical results."""
+        documents = [
+            {
+                "slug": f"doc-{i}",
+                "title": f"Doc {i}",
+                "metadata": {
+                    "topics": [f"topic-{i % 3}"],
+                    "source": {"path": f"docs/section-{i % 2}/doc-{i}.md"},
+                },
+                "intelligence": {"extracted_topics": ["shared", f"topic-{i % 4}"]},
+            }
+            for i in range(8)
+        ]
+
+        for threshold in (0.2, 0.7):
+            linker = CrossLinker(config={"relevance_threshold": threshold})
+            expected = [linker.find_related_documents(d, documents) for d in documents]
+
+            linker.precompute(documents)
+            actual = [linker.find_related_documents(d, documents) for d in documents]
+
+            assert actual == expected
+
+    def test_cross_link_all_with_workers(self):
+        """Test that threaded cross-linking matches per-document linking."""
+        documents = [
+            {
+                "slug": f"doc-{i}",
+                "title": f"Doc {i}",
+                "metadata": {"topics": ["shared", f"topic-{i % 2}"]},
+                "intelligence": {},
+            }
+            for i in range(6)
+        ]
+        linker = CrossLinker(config={"relevance_threshold": 0.2, "max_workers": 4})
+
+        expected = [linker.find_related_documents(d, documents) for d in documents]
+
+        assert linker.cross_link_all(documents) == expected
+
+    def test_candidates_restricted_to_shared_topics(self):
+        """Test that high thresholds only consider documents sharing a topic."""
+        linker = CrossLinker(config={"relevance_threshold": 0.7})
+        documents = [
+            {"slug": "a", "metadata": {"topics": ["react"]}},
+            {"slug": "b", "metadata": {"topics": ["react", "hooks"]}},
+            {"slug": "c", "metadata": {"topics": ["python"]}},
+        ]
+        linker.precompute(documents)
+
+        assert list(linker._candidate_indices(frozenset({"react"}), 3)) == [0, 1]
+
+    def test_relevance_skips_components_below_threshold(self):
+        """Test that relevance stops once the threshold is out of reach."""
+        linker = CrossLinker(config={"relevance_threshold": 0.9})
+
+        doc1 = {"metadata": {"topics": ["react"]}, "intelligence": {}}
+        doc2 = {"metadata": {"topics": ["python"]}, "intelligence": {}}
+
+        with patch(
+            "contextor.intelligence.cross_linking._fingerprint_similarity"
+        ) as fingerprint:
+            score = linker._calculate_relevance(
+                linker._document_features(doc1), linker._document_features(doc2)
+            )
+
+        assert score < linker.relevance_threshold
+        fingerprint.assert_not_called()
+
+    def test_fingerprint_similarity_uses_minhash(self):
+        """Test that MinHash signatures take precedence over fingerprints."""
+        linker = CrossLinker()
+        analyzer = SimilarityAnalyzer()
+        content = " ".join(f"word{i}" for i in range(100))
+
+        doc1 = {
+            "intelligence": {
+                "content_fingerprint": "abc123",
+                "content_minhash": analyzer.generate_minhash(content),
+            }
+        }
+        doc2 = {
+            "intelligence": {
+                "content_fingerprint": "abc124",
+                "content_minhash": analyzer.generate_minhash(content),
+            }
+        }
+        doc3 = {"intelligence": {"content_fingerprint": "abc123"}}
+
+        assert linker._calculate_fingerprint_similarity(doc1, doc2) == 1.0
+        # Without a signature on both sides only exact fingerprints match
+        assert linker._calculate_fingerprint_similarity(doc1, doc3) == 1.0
+        assert linker._calculate_fingerprint_similarity(doc2, doc3) == 0.0
+
     def test_calculate_path_similarity(self):
         """Test path similarity calculation."""
         linker = CrossLinker()
@@ -517,6 +740,7 @@ class TestIntelligenceAnalyzer:
         assert "extracted_topics" in doc_data["intelligence"]
         assert "quality_metrics" in doc_data["intelligence"]
         assert "content_fingerprint" in doc_data["intelligence"]
+        assert "content_minhash" in doc_data["intelligence"]
         assert "last_analyzed" in doc_data["intelligence"]
 
     @patch("contextor.intelligence.analyzer.logger")
@@ -542,6 +766,24 @@ class TestIntelligenceAnalyzer:
             post = frontmatter.load(f)
             assert "intelligence" in post.metadata
 
+    def test_update_mdc_file_replaces_intelligence_block(self, temp_source_dir):
+        """Test that re-analysis replaces the intelligence block in place."""
+        analyzer = IntelligenceAnalyzer(temp_source_dir)
+
+        mdc_path = sorted(temp_source_dir.rglob("*.mdc"))[0]
+        original = frontmatter.load(mdc_path)
+
+        for topics in (["first"], ["second"]):
+            analyzer._update_mdc_file(
+                {"path": mdc_path, "intelligence": {"extracted_topics": topics}}
+            )
+
+        updated = frontmatter.load(mdc_path)
+        assert updated.metadata["intelligence"] == {"extracted_topics": ["second"]}
+        assert updated.content == original.content
+        for key, value in original.metadata.items():
+            assert updated.metadata[key] == value
+
     def test_load_save_analysis_state(self, temp_source_dir):
         """Test analysis state persistence."""
         analyzer = IntelligenceAnalyzer(temp_source_dir)
@@ -1,8 +1,10 @@
 """Tests for document loader functionality."""
 
 import tempfile
+import time
 from pathlib import Path
 from textwrap import dedent
+from unittest.mock import patch
 
 from contextor.loader import DocumentInfo, DocumentLoader
 
@@ -150,6 +152,21 @@ class TestDocumentLoader:
 
         assert title == "Main Title"
 
+    def test_extract_title_skips_frontmatter_parse_without_delimiter(self):
+        """Test that content without front-matter is not parsed as such."""
+        loader = DocumentLoader(self.source_dir, repo="test/repo", ref="main")
+
+        with patch("contextor.loader.frontmatter.loads") as loads:
+            title = loader._extract_title("# Plain Heading\n\nBody", "test.md")
+            assert title == "Plain Heading"
+            loads.assert_not_called()
+
+            # Leading whitespace before the delimiter still triggers the parse
+            loads.return_value.metadata = {"title": "Indented"}
+            title = loader._extract_title("\n---\ntitle: Indented\n---\n", "t.md")
+            assert title == "Indented"
+            loads.assert_called_once()
+
     def test_extract_title_fallback_to_filename(self):
         """Test title fallback to filename."""
         content = "Just some content without frontmatter or headings."
@@ -214,6 +231,46 @@ class TestDocumentLoader:
             in readme_doc.canonical_url
         )
 
+    def test_discover_files_parallel_matches_sequential(self):
+        """Test that threaded reads yield the same documents in the same order."""
+        for i in range(20):
+            self.create_test_file(f"docs/page-{i}.md", f"# Page {i}\n\nBody {i}.")
+        self.create_test_file("docs/broken.md", "# Broken")
+        (self.source_dir / "docs/broken.md").write_bytes(b"\xff\xfe invalid utf-8")
+
+        sequential = DocumentLoader(
+            self.source_dir, repo="test/repo", ref="main", max_workers=1
+        )
+        parallel = DocumentLoader(
+            self.source_dir, repo="test/repo", ref="main", max_workers=8
+        )
+
+        sequential_docs = list(sequential.discover_files())
+        parallel_docs = list(parallel.discover_files())
+
+        # Unreadable files are skipped in both modes
+        assert len(sequential_docs) == 20
+        assert parallel_docs == sequential_docs
+
+    def test_discover_files_parallel_reads_bounded_window(self):
+        """Test that threaded reads stay within a window of the consumer."""
+        for i in range(50):
+            self.create_test_file(f"docs/page-{i}.md", f"# Page {i}")
+
+        loader = DocumentLoader(
+            self.source_dir, repo="test/repo", ref="main", max_workers=2
+        )
+        with patch.object(loader, "_load_one", wraps=loader._load_one) as load:
+            documents = loader.discover_files()
+            next(documents)
+            # A slow consumer: the pool must not read ahead of the window
+            time.sleep(0.2)
+            reads = load.call_count
+            documents.close()
+
+        # Two workers keep at most four reads queued, plus one refill
+        assert reads <= 5
+
     def test_discover_files_with_exclusions(self):
         """Test file discovery respects exclusion patterns."""
         # Create files, some in excluded directories
@@ -227,6 +284,22 @@ class TestDocumentLoader:
         assert len(documents) == 1
         assert documents[0].path == "docs/good.md"
 
+    def test_discover_files_prunes_excluded_directories(self):
+        """Test that wholly excluded directories are skipped during the walk."""
+        self.create_test_file("docs/good.md", "# Good")
+        self.create_test_file("docs/node_modules/nested.md", "# Nested")
+        self.create_test_file("node_modules/pkg/deep.md", "# Deep")
+
+        loader = DocumentLoader(self.source_dir, repo="test/repo", ref="main")
+
+        assert "node_modules" in loader._prunable_directories()
+        assert "docs/node_modules" not in loader._prunable_directories()
+
+        # Exclude patterns are anchored at the source root, so only the
+        # top-level node_modules is skipped
+        paths = {doc.path for doc in loader.discover_files()}
+        assert paths == {"docs/good.md", "docs/node_modules/nested.md"}
+
     def test_discover_files_empty_directory(self):
         """Test discovery in empty directory."""
         loader = DocumentLoader(self.source_dir, repo="test/repo", ref="main")
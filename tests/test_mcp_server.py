@@ -2,15 +2,24 @@
 Contract tests for Contextor MCP Server tools
 """
 
+import asyncio
 import tempfile
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import AsyncMock, patch
 
+import anyio.to_thread
 import pytest
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.testclient import TestClient
 
-from contextor.mcp_server.handlers import SourceDocsHandlers
-from contextor.mcp_server.server import create_app
+from contextor.mcp_server.handlers import SourceDocsHandlers, _text_cache_charge
+from contextor.mcp_server.server import (
+    _WORKER_THREAD_LIMIT,
+    _build_sse_frame,
+    create_app,
+)
+from contextor.mcp_server.tools import CONTEXTOR_TOOLS
 
 
 @pytest.fixture
@@ -154,6 +163,20 @@ class TestGetFile:
         assert "metadata" in result
         assert result["metadata"]["size"] > 0
         assert "modified" in result["metadata"]
+        assert result["metadata"]["line_count"] > 0
+        assert result["metadata"]["word_count"] > 0
+
+    @pytest.mark.asyncio
+    async def test_get_file_without_stats(self, handlers):
+        """Test that content statistics can be skipped"""
+        result = await handlers.get_file(
+            path="anthropic/mcp-connector.md", include_stats=False
+        )
+
+        assert result["status"] == "success"
+        assert result["metadata"]["size"] > 0
+        assert "line_count" not in result["metadata"]
+        assert "word_count" not in result["metadata"]
 
     @pytest.mark.asyncio
     async def test_get_file_by_slug(self, handlers):
@@ -164,6 +187,23 @@ class TestGetFile:
         assert "content" in result
         assert "MCP Connector" in result["content"]
 
+    @pytest.mark.asyncio
+    async def test_get_file_by_slug_sees_tree_changes(self, handlers, temp_sourcedocs):
+        """Test that slug lookups pick up files added or removed after indexing"""
+        assert (await handlers.get_file(slug="mcp-connector"))["status"] == "success"
+
+        nested = temp_sourcedocs / "anthropic" / "guides"
+        nested.mkdir()
+        (nested / "new-guide.md").write_text("# New Guide")
+        (temp_sourcedocs / "anthropic" / "mcp-connector.md").unlink()
+
+        added = await handlers.get_file(slug="new-guide")
+        removed = await handlers.get_file(slug="mcp-connector")
+
+        assert added["status"] == "success"
+        assert added["path"] == "anthropic/guides/new-guide.md"
+        assert removed["status"] == "not_found"
+
     @pytest.mark.asyncio
     async def test_get_nonexistent_file(self, handlers):
         """Test getting a nonexistent file"""
@@ -172,6 +212,15 @@ class TestGetFile:
         assert result["status"] == "not_found"
         assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_get_file_on_directory_or_below_file(self, handlers):
+        """Test that directories and paths through a file are rejected"""
+        directory = await handlers.get_file(path="anthropic")
+        below_file = await handlers.get_file(path="anthropic/mcp-connector.md/x.md")
+
+        assert directory["status"] == "error"
+        assert below_file["status"] == "not_found"
+
     @pytest.mark.asyncio
     async def test_get_file_no_path_or_slug(self, handlers):
         """Test getting a file without path or slug"""
@@ -199,6 +248,25 @@ class TestSearch:
             assert "source" in result
             assert result["score"] > 0
 
+    @pytest.mark.asyncio
+    async def test_search_formats_modified_time(self, handlers, temp_sourcedocs):
+        """Test that returned results carry ISO formatted modification times"""
+        results = await handlers.search(query="MCP", limit=1)
+
+        mtime = (temp_sourcedocs / results[0]["path"]).stat().st_mtime
+        assert results[0]["metadata"]["modified"] == (
+            datetime.fromtimestamp(mtime).isoformat()
+        )
+
+    @pytest.mark.asyncio
+    async def test_iter_search_streams_all_matches(self, handlers):
+        """Test that streamed matches agree with the ranked search results"""
+        streamed = [result async for result in handlers.iter_search(query="MCP")]
+        ranked = await handlers.search(query="MCP", limit=100)
+
+        assert sorted(r["path"] for r in streamed) == sorted(r["path"] for r in ranked)
+        assert all(isinstance(r["metadata"]["modified"], str) for r in streamed)
+
     @pytest.mark.asyncio
     async def test_search_with_source_filter(self, handlers):
         """Test search with source filtering"""
@@ -248,6 +316,62 @@ class TestSearch:
         assert isinstance(results, list)
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_search_sees_changed_files(self, handlers, temp_sourcedocs):
+        """Test that cached file contents are refreshed when a file changes"""
+        doc = temp_sourcedocs / "anthropic" / "remote-mcp-servers.md"
+
+        assert not await handlers.search(query="freshly-added-term")
+
+        doc.write_text(doc.read_text() + "\nfreshly-added-term\n")
+        results = await handlers.search(query="freshly-added-term")
+
+        assert [r["path"] for r in results] == ["anthropic/remote-mcp-servers.md"]
+
+    @pytest.mark.asyncio
+    async def test_text_cache_is_bounded(self, temp_sourcedocs):
+        """Test that the decoded-file cache evicts least recently used files"""
+        handlers = SourceDocsHandlers(temp_sourcedocs, text_cache_size=2)
+
+        results = await handlers.search(query="#")
+
+        assert len(results) == 3
+        assert len(handlers._text_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_text_cache_is_bounded_by_bytes(self, temp_sourcedocs):
+        """Test that the decoded-file cache stays within its memory budget"""
+        charges = sorted(
+            _text_cache_charge(p.read_text(encoding="utf-8"))
+            for p in temp_sourcedocs.rglob("*.md")
+        )
+        handlers = SourceDocsHandlers(temp_sourcedocs, text_cache_bytes=charges[-1])
+
+        await handlers.search(query="#")
+        info = handlers.text_cache_info()
+
+        assert info["files"] == 1
+        assert info["bytes"] <= charges[-1]
+
+    def test_text_cache_charges_decoded_memory(self):
+        """Test that cache entries are charged for text in memory, not on disk"""
+        ascii_text = "a" * 1000
+        wide_text = "\U0001f600" * 1000
+
+        assert _text_cache_charge(ascii_text) >= 2 * len(ascii_text)
+        assert _text_cache_charge(wide_text) >= 8 * len(wide_text)
+
+    @pytest.mark.asyncio
+    async def test_text_cache_counts_hits_and_misses(self, handlers):
+        """Test that repeated searches are served from the cache"""
+        await handlers.search(query="#")
+        await handlers.search(query="#")
+
+        info = handlers.text_cache_info()
+
+        assert info["misses"] == 3
+        assert info["hits"] == 3
+
 
 class TestStats:
     """Test the stats tool"""
@@ -287,6 +411,33 @@ class TestStats:
             assert source_stats["files"] > 0
             assert source_stats["size"] > 0
 
+    @pytest.mark.asyncio
+    async def test_stats_source_count_matches_detailed(self, handlers, temp_sourcedocs):
+        """Test that source_count agrees with the detailed per-source listing"""
+        (temp_sourcedocs / "hidden-only").mkdir()
+        (temp_sourcedocs / "hidden-only" / ".draft.md").write_text("# Draft")
+
+        summary = await handlers.stats()
+        detailed = await handlers.stats(detailed=True)
+
+        assert summary["source_count"] == len(detailed["sources"]) == 2
+        assert summary["total_files"] == detailed["total_files"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stats_skips_tooling_directories(self, handlers, temp_sourcedocs):
+        """Test that .git and node_modules contents are not counted"""
+        before = await handlers.stats()
+
+        (temp_sourcedocs / ".git" / "objects").mkdir(parents=True)
+        (temp_sourcedocs / ".git" / "HEAD").write_text("ref: refs/heads/main")
+        (temp_sourcedocs / "anthropic" / "node_modules").mkdir()
+        (temp_sourcedocs / "anthropic" / "node_modules" / "pkg.md").write_text("# Pkg")
+
+        after = await handlers.stats()
+
+        assert after["total_files"] == before["total_files"]
+        assert after["source_count"] == before["source_count"]
+
 
 class TestErrorHandling:
     """Test error handling scenarios"""
@@ -377,6 +528,30 @@ class TestAPIEndpoints:
         assert "tools" in data
         assert len(data["tools"]) > 0
 
+    def test_startup_raises_worker_thread_limit(self, temp_sourcedocs):
+        """Test the app raises the worker thread limit when streams watch files"""
+        with patch("contextor.mcp_server.server._HAVE_WATCHFILES", True), TestClient(
+            create_app(temp_sourcedocs)
+        ) as client:
+            limiter = client.portal.call(anyio.to_thread.current_default_thread_limiter)
+            assert limiter.total_tokens >= _WORKER_THREAD_LIMIT
+
+    def test_list_tools_endpoint_serves_catalogue(self, client):
+        """Test tools listing returns the full tool catalogue as JSON"""
+        response = client.get("/tools")
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"tools": CONTEXTOR_TOOLS}
+
+    def test_default_response_class_follows_orjson(self, temp_sourcedocs):
+        """Test routes render with orjson when installed and json otherwise"""
+        with patch("contextor.mcp_server.server.HAVE_ORJSON", True):
+            app = create_app(temp_sourcedocs)
+        assert app.router.default_response_class is ORJSONResponse
+
+        with patch("contextor.mcp_server.server.HAVE_ORJSON", False):
+            app = create_app(temp_sourcedocs)
+        assert app.router.default_response_class is JSONResponse
+
     def test_rest_sources_endpoint(self, client):
         """Test REST sources endpoint"""
         response = client.get("/sources")
@@ -478,3 +653,78 @@ class TestAPIEndpoints:
 
         data = response.json()
         assert data["status"] == "success"
+
+
+class TestSSEFrames:
+    """Test Server-Sent Events frame construction"""
+
+    def test_build_sse_frame(self):
+        """Test frames carry the event name and data on separate lines"""
+        frame = _build_sse_frame(b"update", b'{"a": 1}')
+        assert frame == b'event: update\ndata: {"a": 1}\n\n'
+
+
+class TestStream:
+    """Test the /stream Server-Sent Events endpoint"""
+
+    @staticmethod
+    def _stream_endpoint(app):
+        return next(route.endpoint for route in app.routes if route.path == "/stream")
+
+    @pytest.mark.asyncio
+    async def test_stream_waits_on_file_events(self, temp_sourcedocs):
+        """Test updates follow watcher events, falling back to polling"""
+        watched = []
+
+        def fake_awatch(path):
+            async def changes():
+                watched.append(path)
+                yield {("modified", str(path / "anthropic" / "new.md"))}
+                raise RuntimeError("watch limit reached")
+
+            return changes()
+
+        request = AsyncMock()
+        request.is_disconnected.return_value = False
+        sleep = AsyncMock()
+
+        with patch("contextor.mcp_server.server._HAVE_WATCHFILES", True), patch(
+            "contextor.mcp_server.server.awatch", fake_awatch, create=True
+        ), patch("contextor.mcp_server.server.asyncio.sleep", sleep):
+            endpoint = self._stream_endpoint(create_app(temp_sourcedocs))
+            frames = (await endpoint(request)).body_iterator
+
+            # Initial check, then one update per file event without sleeping
+            assert (await anext(frames)).startswith(b"event: update\n")
+            assert (await anext(frames)).startswith(b"event: update\n")
+            sleep.assert_not_called()
+
+            # A failed watcher falls back to the 30 second poll
+            assert (await anext(frames)).startswith(b"event: update\n")
+            sleep.assert_awaited_once_with(30)
+            await frames.aclose()
+
+        assert watched == [temp_sourcedocs.resolve()]
+
+    @pytest.mark.asyncio
+    async def test_stream_wakes_on_real_file_change(self, temp_sourcedocs):
+        """Test watchfiles delivers an update well before the poll interval"""
+        pytest.importorskip("watchfiles")
+
+        request = AsyncMock()
+        request.is_disconnected.return_value = False
+
+        endpoint = self._stream_endpoint(create_app(temp_sourcedocs))
+        frames = (await endpoint(request)).body_iterator
+        try:
+            assert (await anext(frames)).startswith(b"event: update\n")
+
+            next_frame = asyncio.ensure_future(anext(frames))
+            await asyncio.sleep(0.5)  # Let the watcher start
+            (temp_sourcedocs / "anthropic" / "new.md").write_text("# New\n")
+
+            frame = await asyncio.wait_for(next_frame, timeout=10)
+            assert frame.startswith(b"event: update\n")
+            assert b"anthropic" in frame
+        finally:
+            await frames.aclose()
@@ -0,0 +1,90 @@
+"""Tests for the lightweight .mdc reader."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import frontmatter
+
+from contextor.mdc_reader import read_mdc
+from contextor.utils import content_hash
+
+
+class TestReadMdc:
+    """Test .mdc splitting and header parsing."""
+
+    def setup_method(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.mdc_path = Path(self.temp_dir.name) / "doc.mdc"
+
+    def teardown_method(self):
+        """Clean up test environment."""
+        self.temp_dir.cleanup()
+
+    def test_matches_frontmatter_library(self):
+        """Test that metadata and content match python-frontmatter."""
+        self.mdc_path.write_text(
+            '---\ntitle: "Doc"\ntopics:\n  - "a"\n---\n\n# Doc\n\nBody\n---\nTail\n',
+            encoding="utf-8",
+        )
+
+        mdc = read_mdc(self.mdc_path)
+        post = frontmatter.load(self.mdc_path)
+
+        assert mdc.metadata == post.metadata
+        assert mdc.content == post.content
+
+    def test_file_without_frontmatter(self):
+        """Test that files without front-matter have empty metadata."""
+        self.mdc_path.write_text("# Just content\n", encoding="utf-8")
+
+        mdc = read_mdc(self.mdc_path)
+
+        assert mdc.metadata == {}
+        assert mdc.content == "# Just content"
+
+    def test_header_reparsed_after_change(self):
+        """Test that the memoized header is invalidated when the file changes."""
+        self.mdc_path.write_text("---\ntitle: one\n---\nBody\n", encoding="utf-8")
+        assert read_mdc(self.mdc_path).metadata["title"] == "one"
+
+        self.mdc_path.write_text("---\ntitle: second\n---\nBody\n", encoding="utf-8")
+        assert read_mdc(self.mdc_path).metadata["title"] == "second"
+
+    def test_header_reparsed_after_same_size_replace(self):
+        """Test that an atomic same-size rewrite within one mtime is detected."""
+        self.mdc_path.write_text("---\ntitle: one\n---\nBody\n", encoding="utf-8")
+        original = self.mdc_path.stat()
+        assert read_mdc(self.mdc_path).metadata["title"] == "one"
+
+        replacement = self.mdc_path.with_suffix(".tmp")
+        replacement.write_text("---\ntitle: two\n---\nBody\n", encoding="utf-8")
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, self.mdc_path)
+
+        assert read_mdc(self.mdc_path).metadata["title"] == "two"
+
+    def test_metadata_mutation_not_shared(self):
+        """Test that mutating returned metadata does not leak into the cache."""
+        self.mdc_path.write_text("---\ntitle: one\n---\nBody\n", encoding="utf-8")
+        read_mdc(self.mdc_path).metadata["title"] = "changed"
+
+        assert read_mdc(self.mdc_path).metadata["title"] == "one"
+
+    def test_nested_metadata_mutation_not_shared(self):
+        """Test that nested front-matter maps are not shared between readers."""
+        self.mdc_path.write_text(
+            "---\nsource:\n  repo: a/b\n---\nBody\n", encoding="utf-8"
+        )
+        read_mdc(self.mdc_path).metadata["source"]["repo"] = "changed"
+
+        assert read_mdc(self.mdc_path).metadata["source"]["repo"] == "a/b"
+
+    def test_content_hash_matches_utils(self):
+        """Test that hashing the raw body matches hashing decoded content."""
+        self.mdc_path.write_text("---\ntitle: x\n---\n\nCafé ☕\n", encoding="utf-8")
+
+        mdc = read_mdc(self.mdc_path)
+
+        assert mdc.content_hash == content_hash(mdc.content)
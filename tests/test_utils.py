@@ -2,8 +2,17 @@
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
-from contextor.utils import content_hash, ensure_directory, path_to_slug, slugify
+from contextor.utils import (
+    content_hash,
+    dumps_json,
+    ensure_directory,
+    find_files,
+    loads_json,
+    path_to_slug,
+    slugify,
+)
 
 
 class TestSlugify:
@@ -81,6 +90,11 @@ class TestContentHash:
         # Should be deterministic
         assert hash_result == content_hash(unicode_content)
 
+    def test_content_hash_accepts_bytes(self):
+        """Test that hashing UTF-8 bytes matches hashing the text."""
+        text = "Hello 世界 🌍"
+        assert content_hash(text.encode("utf-8")) == content_hash(text)
+
     def test_content_hash_multiline(self):
         """Test content hash with multiline content."""
         multiline = """# Title
@@ -223,3 +237,53 @@ class TestEnsureDirectory:
         assert result.is_dir()
         # Directory should be readable and writable
         assert result.stat().st_mode & 0o700  # At least owner read/write/execute
+
+
+class TestFindFiles:
+    """Test suffix-filtered recursive file discovery."""
+
+    def test_matches_rglob(self):
+        """Test that results and their order match Path.rglob."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "b" / "nested").mkdir(parents=True)
+            (root / "a").mkdir()
+            for name in ["top.mdc", "b/one.mdc", "b/nested/two.mdc", "a/three.mdc"]:
+                (root / name).write_text("x")
+            (root / "b" / "skip.md").write_text("x")
+            (root / "a" / "upper.MDC").write_text("x")
+
+            assert find_files(root, ".mdc") == list(root.rglob("*.mdc"))
+            assert len(find_files(root, ".mdc")) == 4
+
+    def test_missing_directory(self):
+        """Test that a missing directory yields no files."""
+        assert find_files(Path("/nonexistent/path"), ".mdc") == []
+
+
+class TestJson:
+    """Test JSON helpers with and without orjson."""
+
+    def test_round_trip(self):
+        """Test that values survive dumps_json and loads_json."""
+        value = {"slug": "intro", "score": 0.5, "topics": ["a", "é"]}
+
+        assert loads_json(dumps_json(value)) == {
+            "slug": "intro",
+            "score": 0.5,
+            "topics": ["a", "é"],
+        }
+
+    def test_newline(self):
+        """Test that JSON Lines output is newline-terminated."""
+        assert dumps_json([1], newline=True).endswith(b"\n")
+        assert not dumps_json([1]).endswith(b"\n")
+
+    def test_without_orjson(self):
+        """Test that the json fallback produces equivalent output."""
+        value = {"score": 0.25, "n": 3}
+
+        with patch("contextor.utils.HAVE_ORJSON", False):
+            data = dumps_json(value, newline=True)
+            assert data.endswith(b"\n")
+            assert loads_json(data) == {"score": 0.25, "n": 3}